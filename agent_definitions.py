@@ -1,4 +1,4 @@
-from agents import Agent, FileSearchTool
+from agents import Agent, FileSearchTool, ModelSettings
 from openai import OpenAI
 from prompts import standards_prompt, zoning_prompt, orchestration_prompt, calculations_prompt
 from constants import STANDARDS_VECTOR_STORE_ID, ZONING_VECTOR_STORE_ID, DEFAULT_MODEL, MAX_SEARCH_RESULTS
@@ -8,6 +8,7 @@ from tools import (
     combine_line_loads,
     calculate_max_moment,
     calculate_max_shear,
+    calculate_beam_batch,
     list_calculation_tools,
     list_accessible_standards
 )
@@ -48,6 +49,7 @@ calculation_agent = Agent(
         combine_line_loads,
         calculate_max_moment,
         calculate_max_shear,
+        calculate_beam_batch,
     ]
 )
 
@@ -55,6 +57,8 @@ orchestrator_agent = Agent(
     name="Orchestrator",
     model=DEFAULT_MODEL,
     instructions=orchestration_prompt,
+    # Independent tool calls from one turn are run concurrently by the Runner
+    model_settings=ModelSettings(parallel_tool_calls=True),
     tools=[
         standards_agent.as_tool(
             tool_name="standards_agent",
@@ -29,6 +29,7 @@ class Config:
 Centralized Configuration Management
 """
 import os
+import tempfile
 from typing import Optional, Dict, Any
 from utils.logger import app_logger
 
@@ -63,9 +64,19 @@ class Config:
     # API Keys
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
     
+    # LLM inference endpoints; chats are spread across them, one conversation per endpoint
+    LLM_BASE_URLS = [url.strip() for url in os.getenv('LLM_BASE_URLS', '').split(',') if url.strip()]
+
     # Database
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///engineroom.db')
     
+    # Compiled Jinja template cache, shared by workers and kept across restarts
+    JINJA_CACHE_DIR = os.getenv('JINJA_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'engineroom_jinja_cache'))
+
+    # Gzip JSON responses at least this large; level 4 keeps CPU cost low for coordinate payloads
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+    COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', 4))
+
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO' if not DEBUG else 'DEBUG')
     
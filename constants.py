@@ -8,7 +8,6 @@ Centralized configuration values for EngineRoom
 # =============================================================================
 MAX_MESSAGE_LENGTH = 1000
 MAX_CONVERSATION_HISTORY = 50
-STREAMING_WORD_DELAY = 0.01  # Seconds between streamed words
 
 # =============================================================================
 # Database Configuration  
@@ -25,6 +24,7 @@ DEFAULT_MODEL = "gpt-4.1-nano"
 MAX_SEARCH_RESULTS = 5
 MAX_AGENT_ITERATIONS = 10
 AGENT_TIMEOUT_SECONDS = 120
+LLM_CACHE_TTL_SECONDS = 60  # How long inference servers should keep a conversation's KV cache warm
 
 # =============================================================================
 # External Service Configuration
@@ -6,6 +6,7 @@ Application Factory
 Handles Flask application creation and configuration
 """
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 import os
 from typing import Optional
 
@@ -14,7 +15,9 @@ from routes import register_all_routes
 from database import db_manager
 from utils.logger import setup_logger
 from core.error_handlers import register_error_handlers
+from core.compression import register_compression
 from core.service_manager import ServiceManager
+from utils.json_utils import ORJSON_AVAILABLE
 from routes.main_routes import main_route_handler
 from routes.auth_routes import auth_route_handler
 from routes.location_routes import location_route_handler
@@ -49,6 +52,15 @@ class AppFactory:
                    static_folder=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static'))
             app.secret_key = Config.SECRET_KEY
 
+            # Persist compiled templates so restarts and new workers skip Jinja compilation
+            os.makedirs(Config.JINJA_CACHE_DIR, exist_ok=True)
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(Config.JINJA_CACHE_DIR)
+
+            # Route jsonify and request.get_json through orjson when installed
+            if ORJSON_AVAILABLE:
+                from core.json_provider import OrjsonJSONProvider
+                app.json = OrjsonJSONProvider(app)
+
             # Configure database for production
             if Config.ENVIRONMENT == 'production':
                 # Set shorter timeouts for production
@@ -56,6 +68,7 @@ class AppFactory:
             
             # Register components
             register_error_handlers(app)
+            register_compression(app)
             success, errors = register_all_routes(app)
 
             if not success:
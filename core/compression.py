@@ -0,0 +1,36 @@
+"""
+Response Compression
+Gzip large JSON responses for clients that accept it
+"""
+import gzip
+
+from flask import Flask, Response, request
+
+from config import Config
+
+
+def register_compression(app: Flask):
+    """Register an after-request hook that gzips large JSON bodies"""
+
+    @app.after_request
+    def compress_json_response(response: Response) -> Response:
+        if (response.status_code != 200
+                or response.is_streamed
+                or response.mimetype != 'application/json'
+                or 'Content-Encoding' in response.headers
+                or not request.accept_encodings['gzip']):
+            return response
+
+        body = response.get_data()
+        if len(body) < Config.COMPRESS_MIN_SIZE:
+            return response
+
+        response.set_data(gzip.compress(body, compresslevel=Config.COMPRESS_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+
+        # The gzipped bytes are a different representation, so a strong validator no longer holds
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
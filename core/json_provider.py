@@ -0,0 +1,32 @@
+"""
+JSON Provider
+orjson-backed Flask JSON provider for jsonify and request.get_json
+"""
+import typing as t
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's default provider using orjson"""
+
+    # Datetimes go through Flask's default hook so responses keep the HTTP date format
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _options(self) -> int:
+        options = self.OPTIONS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        return orjson.loads(s)
+
+    def response(self, *args: t.Any, **kwargs: t.Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -1,9 +1,13 @@
 """
 Database Layer - Centralized database operations
 """
+import atexit
+import collections
+import queue
 import sqlite3
 import threading
 import time
+import uuid
 from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 from utils.logger import app_logger
@@ -16,12 +20,20 @@ class DatabaseError(Exception):
     pass
 
 
+# Idle read-only connections kept for reuse; werkzeug serves each request on a new
+# thread, so thread-local readers would open (and leak) one connection per request
+READER_POOL_SIZE = 8
+
+
 class DatabaseConnection:
     """Thread-safe database connection manager"""
 
     def __init__(self, db_path: str = 'engineroom.db'):
         self.db_path = db_path
         self._local = threading.local()
+        self._readers = queue.LifoQueue(maxsize=READER_POOL_SIZE)
+        self._reader_lock = threading.Lock()
+        self._reader_ready = False
 
     def get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection"""
@@ -41,8 +53,28 @@ class DatabaseConnection:
             self._local.connection.execute("PRAGMA busy_timeout=30000")
             self._local.connection.execute("PRAGMA wal_autocheckpoint=1000")  # Less frequent checkpoints
             self._local.connection.execute("PRAGMA read_uncommitted=true")  # Allow dirty reads for better concurrency
+            self._local.connection.execute("PRAGMA mmap_size=268435456")  # Memory-map up to 256MB of the file
         return self._local.connection
 
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection; WAL lets it read while writers commit"""
+        if not self._reader_ready:
+            with self._reader_lock:
+                if not self._reader_ready:
+                    # Ensure the database exists and is in WAL mode before opening read-only
+                    self.get_connection()
+                    self._reader_ready = True
+        reader = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            timeout=30.0
+        )
+        reader.row_factory = sqlite3.Row
+        reader.execute("PRAGMA busy_timeout=30000")
+        reader.execute("PRAGMA mmap_size=268435456")
+        return reader
+
     @contextmanager
     def get_cursor(self):
         """Get database cursor with automatic cleanup"""
@@ -58,6 +90,26 @@ class DatabaseConnection:
         finally:
             cursor.close()
 
+    @contextmanager
+    def get_read_cursor(self):
+        """Get read-only database cursor from the reader pool with automatic cleanup"""
+        try:
+            reader = self._readers.get_nowait()
+        except queue.Empty:
+            reader = self._open_reader()
+        cursor = reader.cursor()
+        try:
+            yield cursor
+        except Exception as e:
+            app_logger.error(f"Database read failed: {e}")
+            raise DatabaseError(f"Database read failed: {e}")
+        finally:
+            cursor.close()
+            try:
+                self._readers.put_nowait(reader)
+            except queue.Full:
+                reader.close()
+
 
 class DatabaseManager:
     """Database operations manager"""
@@ -164,10 +216,17 @@ class DatabaseManager:
                 role TEXT NOT NULL,
                 content TEXT NOT NULL,
                 timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                conversation_id TEXT
+                conversation_id TEXT,
+                message_uid TEXT
             )
         ''')
 
+        # Add message_uid if it doesn't exist (migration)
+        cursor.execute("PRAGMA table_info(messages)")
+        columns = [column[1] for column in cursor.fetchall()]
+        if 'message_uid' not in columns:
+            cursor.execute('ALTER TABLE messages ADD COLUMN message_uid TEXT')
+
     def _create_projects_table(self, cursor):
         """Create projects table"""
         cursor.execute('''
@@ -337,10 +396,14 @@ class DatabaseManager:
             'CREATE INDEX IF NOT EXISTS idx_conversations_session_id ON conversations(session_id)',
             'CREATE INDEX IF NOT EXISTS idx_users_username ON users(username)',
             'CREATE INDEX IF NOT EXISTS idx_user_profiles_user_id ON user_profiles(user_id)',
+            # Covers the users/user_profiles profile JOIN so it never touches the user_profiles table
+            'CREATE INDEX IF NOT EXISTS idx_user_profiles_cover ON user_profiles(user_id, account_type, first_name, last_name, profile_picture)',
             'CREATE UNIQUE INDEX IF NOT EXISTS idx_team_invitations_token ON team_invitations(invitation_token)',
             'CREATE INDEX IF NOT EXISTS idx_projects_user_id ON projects(user_id)',
             'CREATE INDEX IF NOT EXISTS idx_project_history_project_id ON project_history(project_id)',
             'CREATE INDEX IF NOT EXISTS idx_project_snapshots_project_id ON project_snapshots(project_id)',
+            # project_snapshots(project_id INTEGER, user_id INTEGER): serves the per-user snapshot load in index order
+            'CREATE INDEX IF NOT EXISTS idx_project_snapshots_project_user_updated ON project_snapshots(project_id, user_id, updated_at)',
             'CREATE INDEX IF NOT EXISTS idx_project_comments_project_id ON project_comments(project_id)',
             'CREATE INDEX IF NOT EXISTS idx_project_notes_project_id ON project_notes(project_id)'
         ]
@@ -348,6 +411,30 @@ class DatabaseManager:
         for index_sql in indexes:
             cursor.execute(index_sql)
 
+        self._create_snapshot_type_index(cursor)
+
+    def _create_snapshot_type_index(self, cursor):
+        """Back INSERT OR REPLACE on project_snapshots with a unique (project_id, snapshot_type) index"""
+        # Tables first created by _create_project_history_table lack the UNIQUE constraint, so
+        # INSERT OR REPLACE there never replaced and may have left superseded rows behind
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_project_snapshots_project_type'"
+        )
+        if cursor.fetchone():
+            return
+        cursor.execute('''
+            DELETE FROM project_snapshots
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM project_snapshots GROUP BY project_id, snapshot_type
+            )
+        ''')
+        if cursor.rowcount:
+            app_logger.info(f"Removed {cursor.rowcount} superseded project snapshots")
+        cursor.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS idx_project_snapshots_project_type '
+            'ON project_snapshots(project_id, snapshot_type)'
+        )
+
     # User management methods
     def update_user_role(self, user_id: int, new_role: str) -> bool:
         """Update user role"""
@@ -1016,9 +1103,181 @@ def get_conversation_history(session_id: str, limit: int = 50) -> List[Dict[str,
     return MessageRepository.get_conversation_history(session_id, limit)
 
 
+class MessageWriteBuffer:
+    """Background writer that batches message INSERTs into single transactions"""
+
+    def __init__(self, batch_size: int = 64, max_linger: float = 0.05):
+        self.batch_size = batch_size
+        self.max_linger = max_linger
+        self._pending = collections.deque()
+        # Guards _pending and _writing; a batch is marked as being written in the same step it leaves
+        # _pending, so flush() never sees rows that are neither queued nor committed
+        self._condition = threading.Condition()
+        self._writing = False
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the writer thread once and flush pending rows at interpreter exit"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="MessageWriter", daemon=True)
+            self._thread.start()
+
+        atexit.register(self.flush)
+
+    def enqueue(self, session_id: str, role: str, content: str, conversation_id: Optional[str] = None,
+                message_uid: Optional[str] = None) -> None:
+        """Queue a message row, capturing its timestamp now to preserve ordering"""
+        timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        with self._condition:
+            self._pending.append((session_id, role, content, conversation_id, timestamp, message_uid))
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Synchronously write everything queued, after any batch the writer thread is committing"""
+        with self._condition:
+            while self._writing:
+                self._condition.wait()
+            rows = self._take(len(self._pending))
+        if rows:
+            self._write_batch(rows)
+
+    def _take(self, count: int) -> List[Tuple[Any, ...]]:
+        """Remove up to count rows and mark them as being written (caller holds the condition)"""
+        rows = [self._pending.popleft() for _ in range(min(count, len(self._pending)))]
+        if rows:
+            self._writing = True
+        return rows
+
+    def _run(self) -> None:
+        """Drain the queue in batches of up to batch_size rows"""
+        while True:
+            with self._condition:
+                while not self._pending or self._writing:
+                    self._condition.wait()
+                deadline = time.monotonic() + self.max_linger
+                while len(self._pending) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._writing:
+                    # flush() took over while we lingered
+                    continue
+                rows = self._take(self.batch_size)
+            if rows:
+                self._write_batch(rows)
+
+    def _write_batch(self, rows: List[Tuple[Any, ...]]) -> None:
+        """Write rows taken by _take, then let waiting flushes proceed"""
+        try:
+            self._write(rows)
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def _write(self, rows: List[Tuple[Any, ...]]) -> None:
+        """Insert a batch of message rows in one transaction"""
+        try:
+            with db_manager.db.get_cursor() as cursor:
+                cursor.executemany('''
+                    INSERT INTO messages (session_id, role, content, conversation_id, timestamp, message_uid)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
+            app_logger.debug(f"Flushed {len(rows)} queued messages")
+        except Exception as e:
+            app_logger.error(f"Failed to flush {len(rows)} queued messages: {e}")
+
+
+message_write_buffer = MessageWriteBuffer()
+
+
+class ConversationHistoryCache:
+    """In-memory copy of each session's most recent messages, kept in step with every message write"""
+
+    def __init__(self, max_messages: int = 50, max_sessions: int = 1024, ttl: float = 1800.0):
+        self.max_messages = max_messages
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._write_count = 0
+        self._lock = threading.Lock()
+
+    def write_count(self) -> int:
+        """Counter of appends and invalidations, taken before a database read to detect racing writes"""
+        with self._lock:
+            return self._write_count
+
+    def get(self, session_id: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Last `limit` cached messages in chronological order, or None on a miss"""
+        if limit > self.max_messages:
+            return None
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                return None
+            messages = entry[1]
+            return [dict(message) for message in messages[-limit:]] if limit > 0 else []
+
+    def put(self, session_id: str, messages: List[Dict[str, Any]], limit: int, write_count: int) -> None:
+        """Cache a freshly read history, unless it may be partial or a message was written during the read"""
+        if limit < self.max_messages and len(messages) >= limit:
+            return
+        with self._lock:
+            if write_count != self._write_count:
+                return
+            self._entries.pop(session_id, None)
+            if len(self._entries) >= self.max_sessions:
+                self._entries.pop(next(iter(self._entries)), None)
+            self._entries[session_id] = (time.monotonic(), [dict(message) for message in messages[-self.max_messages:]])
+
+    def append(self, session_id: str, message: Dict[str, Any]) -> None:
+        """Add a newly written message to a cached session, if it is cached"""
+        with self._lock:
+            self._write_count += 1
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return
+            messages = entry[1]
+            messages.append(message)
+            if len(messages) > self.max_messages:
+                del messages[0]
+
+    def invalidate(self, session_id: str) -> None:
+        """Forget a session's cached history"""
+        with self._lock:
+            self._write_count += 1
+            self._entries.pop(session_id, None)
+
+
+conversation_history_cache = ConversationHistoryCache()
+
+
 class MessageRepository:
     """Repository for message operations"""
 
+    @staticmethod
+    def enqueue_message(session_id: str, role: str, content: str, conversation_id: Optional[str] = None) -> str:
+        """Queue a message for batched background insertion, returning its message_uid"""
+        # Generated here rather than read from lastrowid, since the row is not inserted yet
+        message_uid = uuid.uuid4().hex
+        message_write_buffer.enqueue(session_id, role, content, conversation_id, message_uid)
+        MessageRepository._cache_message(session_id, role, content, conversation_id)
+        return message_uid
+
+    @staticmethod
+    def _cache_message(session_id: str, role: str, content: str, conversation_id: Optional[str]) -> None:
+        """Mirror a written message into the cached history, stamped like the CURRENT_TIMESTAMP default"""
+        conversation_history_cache.append(session_id, {
+            'role': role,
+            'content': content,
+            'timestamp': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
+            'conversation_id': conversation_id
+        })
+
     @staticmethod
     def save_message(session_id: str, role: str, content: str, conversation_id: Optional[str] = None) -> str:
         """Save a message to the database"""
@@ -1030,8 +1289,9 @@ class MessageRepository:
                 ''', (session_id, role, content, conversation_id))
 
                 message_id = str(cursor.lastrowid)
-                app_logger.debug(f"Message saved: {message_id}")
-                return message_id
+            app_logger.debug(f"Message saved: {message_id}")
+            MessageRepository._cache_message(session_id, role, content, conversation_id)
+            return message_id
 
         except Exception as e:
             app_logger.error(f"Failed to save message: {e}")
@@ -1040,19 +1300,28 @@ class MessageRepository:
     @staticmethod
     def get_conversation_history(session_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get conversation history for a session"""
+        cached = conversation_history_cache.get(session_id, limit)
+        if cached is not None:
+            return cached
+
         try:
+            write_count = conversation_history_cache.write_count()
+            # Queued or in-flight rows may not be committed yet; the cache already holds them, the table may not
+            message_write_buffer.flush()
             with db_manager.db.get_cursor() as cursor:
+                # id breaks timestamp ties, so rows batched within one second keep their queue order
                 cursor.execute('''
                     SELECT role, content, timestamp, conversation_id
                     FROM messages 
                     WHERE session_id = ?
-                    ORDER BY timestamp DESC
+                    ORDER BY timestamp DESC, id DESC
                     LIMIT ?
                 ''', (session_id, limit))
 
                 messages = [dict(row) for row in cursor.fetchall()]
-                messages.reverse()  # Return in chronological order
-                return messages
+            messages.reverse()  # Return in chronological order
+            conversation_history_cache.put(session_id, messages, limit, write_count)
+            return messages
 
         except Exception as e:
             app_logger.error(f"Failed to get conversation history: {e}")
@@ -1062,11 +1331,14 @@ class MessageRepository:
     def clear_session_history(session_id: str) -> int:
         """Clear all messages for a session"""
         try:
+            # Write out queued rows first so none reappear after the reset
+            message_write_buffer.flush()
             with db_manager.db.get_cursor() as cursor:
                 cursor.execute('DELETE FROM messages WHERE session_id = ?', (session_id,))
                 deleted_count = cursor.rowcount
-                app_logger.info(f"Cleared {deleted_count} messages for session {session_id[:8]}")
-                return deleted_count
+            conversation_history_cache.invalidate(session_id)
+            app_logger.info(f"Cleared {deleted_count} messages for session {session_id[:8]}")
+            return deleted_count
 
         except Exception as e:
             app_logger.error(f"Failed to clear session history: {e}")
@@ -3,11 +3,17 @@ EngineRoom - Engineering AI Application
 Main application entry point with improved modular architecture
 """
 import os
+from werkzeug.serving import WSGIRequestHandler
 from core.app_factory import AppFactory
 from utils.logger import setup_logger, app_logger
 from config import Config
 
 
+class KeepAliveRequestHandler(WSGIRequestHandler):
+    """Serve HTTP/1.1 so clients reuse one connection for polling and API requests"""
+    protocol_version = "HTTP/1.1"
+
+
 def create_app():
     """Create Flask application using factory pattern"""
     return AppFactory.create_app()
@@ -34,7 +40,8 @@ def main():
                 port=port,
                 debug=False,
                 threaded=True,
-                use_reloader=False
+                use_reloader=False,
+                request_handler=KeepAliveRequestHandler
             )
         else:
             # Development configuration
@@ -42,7 +49,8 @@ def main():
                 host='0.0.0.0',
                 port=port,
                 debug=Config.DEBUG,
-                threaded=True
+                threaded=True,
+                request_handler=KeepAliveRequestHandler
             )
 
     except Exception as e:
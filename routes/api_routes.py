@@ -2,14 +2,41 @@
 """
 General API Routes Module
 """
-from flask import request, jsonify
+import logging
+from functools import lru_cache
+from flask import Response, request
 from typing import Tuple, Dict, Any
 from services import api_calculation_service
 from services.location_service import LocationService
 from utils.logger import app_logger
 from utils.error_handler import ErrorHandler, ErrorCategories
 from services import response_service
+from services.response_service import JSON_HEADERS
 from utils.timezone_helper import TimezoneHelper
+from utils.json_utils import dumps_bytes
+
+# Standard New Zealand locations, serialized once at import time
+NZ_LOCATIONS = (
+    "Auckland", "Wellington", "Christchurch", "Hamilton",
+    "Tauranga", "Dunedin", "Palmerston North", "Hastings",
+    "Napier", "Rotorua", "New Plymouth", "Whangarei"
+)
+_LOCATIONS_BODY = dumps_bytes(NZ_LOCATIONS)
+
+# Bodies for the closed set of request errors, encoded once rather than per failed request.
+# Only the bytes are shared; each request still gets its own Response, since after-request
+# hooks (e.g. the session cookie) mutate response headers.
+_ERR_TIMEZONE_REQUIRED = dumps_bytes({'error': 'Timezone is required'})
+_ERR_TIMEZONE_INVALID = dumps_bytes({'error': 'Invalid timezone'})
+_ERR_TIMEZONE_FAILED = dumps_bytes({'error': 'Failed to set timezone'})
+_ERR_QUERY_REQUIRED = dumps_bytes({'success': False, 'error': 'Location query is required', 'status_code': 400, 'error_code': 'VALIDATION_ERROR'})
+_ERR_QUERY_EMPTY = dumps_bytes({'success': False, 'error': 'Location query cannot be empty', 'status_code': 400, 'error_code': 'VALIDATION_ERROR'})
+
+
+@lru_cache(maxsize=512)
+def _timezone_set_body(timezone_name: str) -> bytes:
+    """Success body for a timezone that has already been validated"""
+    return dumps_bytes({'success': True, 'timezone': timezone_name})
 
 
 class ApiRoutes:
@@ -25,13 +52,7 @@ class ApiRoutes:
     def handle_get_locations(self) -> Tuple[Dict[str, Any], int]:
         """Get available locations for user selection"""
         try:
-            # Standard New Zealand locations
-            locations = [
-                "Auckland", "Wellington", "Christchurch", "Hamilton", 
-                "Tauranga", "Dunedin", "Palmerston North", "Hastings",
-                "Napier", "Rotorua", "New Plymouth", "Whangarei"
-            ]
-            return jsonify(locations), 200
+            return Response(_LOCATIONS_BODY, mimetype='application/json'), 200
 
         except Exception as e:
             return ErrorHandler.handle_error(
@@ -57,17 +78,20 @@ class ApiRoutes:
                     "Site coordinates and requirements are required"
                 )
 
-            app_logger.info(f"Calculating buildable area - coords: {len(site_coords)}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Calculating buildable area - coords: {len(site_coords)}")
 
-            result = api_calculation_service.calculate_buildable_area(
+            # Geometry is CPU-bound, so it runs in the calculation process pool
+            result = api_calculation_service.calculate_buildable_area_offloaded(
                 site_coords=site_coords,
                 requirements=requirements,
                 frontage=frontage,
                 edge_classifications=edge_classifications
             )
 
-            app_logger.info(f"Buildable area calculated: {result.get('buildable_area_m2', 0):.1f} m²")
-            return response_service.success(result, "Buildable area calculated successfully")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Buildable area calculated: {result.get('buildable_area_m2', 0):.1f} m²")
+            return response_service.fast_success(result, "Buildable area calculated successfully")
 
         except Exception as e:
             return ErrorHandler.handle_error(
@@ -81,27 +105,29 @@ class ApiRoutes:
         try:
             data = request.get_json()
             if not data or not data.get('query'):
-                return response_service.validation_error('Location query is required'), 400
+                return _ERR_QUERY_REQUIRED, 400, JSON_HEADERS
 
             query = data['query'].strip()
             if not query:
-                return response_service.validation_error('Location query cannot be empty'), 400
+                return _ERR_QUERY_EMPTY, 400, JSON_HEADERS
 
-            app_logger.info(f"Geocoding location query: {query}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Geocoding location query: {query}")
 
-            # Use the location service to geocode
-            location_data, error = LocationService.geocode_location(query)
+            # Use the location service to geocode (cached, concurrent duplicates share one lookup)
+            location_data, error = LocationService.geocode_location_shared(query)
 
             if error:
                 app_logger.warning(f"Geocoding failed for '{query}': {error}")
-                return response_service.validation_error(error), 400
+                return response_service.validation_error(error)
 
             if not location_data:
-                return response_service.validation_error(f"No results found for '{query}'"), 404
+                return response_service.error(f"No results found for '{query}'", 404, 'NOT_FOUND')
 
-            app_logger.info(f"Successfully geocoded '{query}' to {location_data['display_name']}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Successfully geocoded '{query}' to {location_data['display_name']}")
 
-            return response_service.success({
+            return response_service.fast_success({
                 'location': location_data
             }, "Location geocoded successfully")
 
@@ -118,16 +144,16 @@ class ApiRoutes:
         try:
             data = request.get_json()
             if not data or 'timezone' not in data:
-                return jsonify({'error': 'Timezone is required'}), 400
+                return _ERR_TIMEZONE_REQUIRED, 400, JSON_HEADERS
 
             timezone_name = data['timezone']
 
             if TimezoneHelper.set_user_timezone(timezone_name):
                 app_logger.info(f"User timezone set to: {timezone_name}")
-                return jsonify({'success': True, 'timezone': timezone_name})
+                return _timezone_set_body(timezone_name), 200, JSON_HEADERS
             else:
-                return jsonify({'error': 'Invalid timezone'}), 400
+                return _ERR_TIMEZONE_INVALID, 400, JSON_HEADERS
 
         except Exception as e:
             app_logger.error(f"Error setting user timezone: {e}")
-            return jsonify({'error': 'Failed to set timezone'}), 500
+            return _ERR_TIMEZONE_FAILED, 500, JSON_HEADERS
@@ -1,7 +1,8 @@
 """Modified authentication routes to include user profile data in dashboard settings."""
 from flask import request, jsonify, render_template, session, url_for, redirect
 from auth import authenticate_user, create_user, create_user_extended, hash_password, verify_password, get_user_by_id, authenticate_user_by_email
-from database import UserProfileRepository, DatabaseManager
+from database import UserProfileRepository, db_manager
+from services import user_profile_service
 from utils.logger import app_logger
 from utils.validators import ValidationError
 
@@ -10,7 +11,7 @@ class AuthRoutes:
     """Authentication route handlers"""
 
     def __init__(self):
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager
 
     def register_routes(self, app):
         """Register authentication routes with Flask app"""
@@ -270,6 +271,8 @@ class AuthRoutes:
                 if not UserProfileRepository.save_user_profile(user_id, profile_data):
                     return jsonify({'error': 'Failed to update profile'}), 500
 
+            user_profile_service.invalidate(user_id)
+
             # Update session if email was changed
             if 'email' in profile_data:
                 session['user']['email'] = profile_data['email']
@@ -482,6 +485,7 @@ class AuthRoutes:
                     WHERE id = ?
                 ''', (user_id,))
 
+            user_profile_service.invalidate(user_id)
             app_logger.info(f"Team '{team_name}' created successfully for user {user_id} with ID {team_id}")
 
             return jsonify({
@@ -543,6 +547,7 @@ class AuthRoutes:
                 if 'team_id' in session['user']:
                     del session['user']['team_id']
 
+            user_profile_service.invalidate(user_id)
             app_logger.info(f"User {user_id} left team {team_id}")
 
             return jsonify({
@@ -633,6 +638,7 @@ class AuthRoutes:
                     pass
                 return jsonify({'error': 'Failed to update profile picture in database'}), 500
 
+            user_profile_service.invalidate(user_id)
             app_logger.info(f"Profile picture updated successfully for user {user_id}: {filename}")
 
             return jsonify({
@@ -855,6 +861,8 @@ class AuthRoutes:
                 # Delete the team
                 cursor.execute('DELETE FROM teams WHERE id = ?', (team_id,))
 
+            # Account type changes for every former member
+            user_profile_service.clear_cache()
             app_logger.info(f"Team '{team_name}' (ID: {team_id}) deleted successfully by user {user_id}")
 
             return jsonify({
@@ -901,6 +909,7 @@ class AuthRoutes:
 
             # Accept the invitation
             if TeamInvitationRepository.accept_invitation(invitation['id'], user_id):
+                user_profile_service.invalidate(user_id)
                 app_logger.info(f"User {user_id} joined team {invitation['team_id']} via invitation token")
                 return jsonify({
                     'success': True,
@@ -916,33 +925,7 @@ class AuthRoutes:
 
     def get_user_profile(self, user_id: int) -> dict:
         """Get user profile data from database"""
-        try:
-            with self.db_manager.db.get_cursor() as cursor:
-                cursor.execute('''
-                    SELECT u.id, u.username, u.email, u.created_at, u.last_login,
-                           p.first_name, p.last_name, p.profile_picture
-                    FROM users u
-                    LEFT JOIN user_profiles p ON u.id = p.user_id
-                    WHERE u.id = ?
-                ''', (user_id,))
-
-                user_data = cursor.fetchone()
-                if user_data:
-                    return {
-                        'id': user_data[0],
-                        'username': user_data[1],
-                        'email': user_data[2],
-                        'created_at': user_data[3],
-                        'last_login': user_data[4],
-                        'first_name': user_data[5],
-                        'last_name': user_data[6],
-                        'profile_picture': user_data[7]
-                    }
-                return {}
-
-        except Exception as e:
-            app_logger.error(f"Failed to get user profile: {e}")
-            return {}
+        return user_profile_service.get_profile(user_id)
 
 
 # Create route handler instance
@@ -1,18 +1,38 @@
 """
 Core Application Routes Module - Streamlined
 """
-from flask import Flask, request, jsonify, render_template, session
+from flask import Flask, Response, request, jsonify, render_template, session, stream_with_context
 from typing import Tuple, Dict, Any
 import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
 from datetime import datetime
 
 from auth import get_session_id
-from database import DatabaseManager
-from services import ChatService, response_service
-from database import MessageRepository
+from database import db_manager
+from services import ChatService, response_service, user_profile_service
+from services.chat_service import sse_frame
+from database import MessageRepository, message_write_buffer
 from utils.validators import validate_message, validate_session_id, ValidationError
 from utils.logger import app_logger
 from utils.error_handler import ErrorHandler, ErrorCategories
+from constants import AGENT_TIMEOUT_SECONDS
+from utils.json_utils import dumps_bytes
+
+# Marks the end of a streamed chat response on the chunk queue
+_STREAM_END = object()
+
+# Keep proxies (nginx) from buffering or caching the event stream. Connection is
+# hop-by-hop and left to the WSGI server, which rejects it from applications.
+_SSE_HEADERS = {
+    'Cache-Control': 'no-cache',
+    'X-Accel-Buffering': 'no'
+}
+
+# Conversations are not persisted per user yet, so the response body never changes
+_EMPTY_CONVERSATIONS_BODY = dumps_bytes(response_service.success({'conversations': []})[0])
 
 
 class MainRoutes:
@@ -20,7 +40,14 @@ class MainRoutes:
 
     def __init__(self):
         self.chat_service = ChatService(enable_streaming=True)
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager
+
+        # Persistent event loop so agent clients and connection pools survive across requests
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="ChatEventLoop", daemon=True).start()
+
+        # Background writer batches chat message INSERTs off the request path
+        message_write_buffer.start()
 
     def register_routes(self, app: Flask) -> None:
         """Register core application routes"""
@@ -44,26 +71,16 @@ class MainRoutes:
             return redirect(url_for('login'))
 
         # Get user profile to include account type
-        try:
-            with self.db_manager.db.get_cursor() as cursor:
-                cursor.execute('''
-                    SELECT u.username, u.email, p.account_type
-                    FROM users u
-                    LEFT JOIN user_profiles p ON u.id = p.user_id
-                    WHERE u.id = ?
-                ''', (user_info['id'],))
-
-                user_data = cursor.fetchone()
-                if user_data:
-                    user_info.update({
-                        'username': user_data[0],
-                        'email': user_data[1],
-                        'account_type': user_data[2] or 'individual'
-                    })
-        except Exception as e:
-            app_logger.error(f"Failed to get user profile for dashboard: {e}")
-
-        app_logger.info(f"Dashboard accessed by user: {user_info.get('username', 'Unknown')}")
+        user_profile = user_profile_service.get_profile(user_info['id'])
+        if user_profile:
+            user_info.update({
+                'username': user_profile['username'],
+                'email': user_profile['email'],
+                'account_type': user_profile['account_type']
+            })
+
+        if app_logger.isEnabledFor(logging.INFO):
+            app_logger.info(f"Dashboard accessed by user: {user_info.get('username', 'Unknown')}")
         return render_template('dashboard.html', user=user_info)
 
     def handle_chat(self) -> Tuple[Any, int]:
@@ -85,38 +102,57 @@ class MainRoutes:
             session_id = get_session_id()
             validate_session_id(session_id)
 
-            app_logger.info(f"Processing chat message for session {session_id[:8]}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Processing chat message for session {session_id[:8]}")
 
             # Get agent type from request
             agent_type = data.get('agent')
             
-            # Generate AI response
-            response_text, message_id = asyncio.run(
-                self.chat_service.process_message(user_message, session_id, conversation_id, agent_type)
-            )
-
-            # Save user message
-            MessageRepository.save_message(session_id, 'user', user_message, conversation_id)
-
-            # Return appropriate response
+            # Pipe agent deltas straight to the client as they are generated
             if self.chat_service.enable_streaming:
+                chunk_queue = queue.Queue()
+                stream_future = asyncio.run_coroutine_threadsafe(
+                    self._pump_chat_stream(chunk_queue, user_message, session_id, conversation_id, agent_type),
+                    self._loop
+                )
+
                 def generate_streaming_response():
                     if conversation_id:
-                        yield f'data: {{"conversation_id": "{conversation_id}"}}\n\n'
+                        yield sse_frame({"conversation_id": conversation_id})
+
+                    try:
+                        while (chunk := chunk_queue.get(timeout=AGENT_TIMEOUT_SECONDS)) is not _STREAM_END:
+                            yield sse_frame(chunk)
+                    except queue.Empty:
+                        app_logger.warning(f"Chat stream timed out for session {session_id[:8]}")
+                        yield sse_frame({'error': 'The assistant took too long to respond'})
+                    finally:
+                        # Timeout or client disconnect: stop the agent run on the event loop
+                        stream_future.cancel()
+
+                return Response(
+                    stream_with_context(generate_streaming_response()),
+                    mimetype='text/event-stream',
+                    headers=_SSE_HEADERS
+                )
 
-                    for chunk in self.chat_service.generate_streaming_response(response_text, message_id):
-                        yield chunk
+            # Generate AI response
+            future = asyncio.run_coroutine_threadsafe(
+                self.chat_service.process_message(user_message, session_id, conversation_id, agent_type),
+                self._loop
+            )
+            try:
+                response_text, message_id = future.result(timeout=AGENT_TIMEOUT_SECONDS)
+            except concurrent.futures.TimeoutError:
+                # Stop the agent run on the event loop instead of letting it finish unobserved
+                future.cancel()
+                raise
 
-                return app.response_class(
-                    generate_streaming_response(),
-                    mimetype='text/plain'
-                )
-            else:
-                return response_service.success({
-                    'response': response_text,
-                    'message_id': message_id,
-                    'conversation_id': conversation_id
-                })
+            return response_service.success({
+                'response': response_text,
+                'message_id': message_id,
+                'conversation_id': conversation_id
+            })
 
         except ValidationError as e:
             app_logger.warning(f"Validation error: {e}")
@@ -128,16 +164,30 @@ class MainRoutes:
                 context={'operation': 'chat_processing'}
             ), 500
 
+    async def _pump_chat_stream(self, chunk_queue: queue.Queue, user_message: str, session_id: str,
+                                conversation_id: str = None, agent_type: str = None) -> None:
+        """Forward streamed chat chunks from the event loop onto a thread-safe queue"""
+        try:
+            async for chunk in self.chat_service.stream_message(user_message, session_id, conversation_id, agent_type):
+                chunk_queue.put(chunk)
+        except Exception as e:
+            app_logger.error(f"Chat stream failed for session {session_id[:8]}: {e}")
+            chunk_queue.put({'error': str(e)})
+        finally:
+            chunk_queue.put(_STREAM_END)
+
     def handle_reset_session(self) -> Tuple[Dict[str, Any], int]:
         """Reset user session with proper cleanup"""
         try:
             session_id = get_session_id()
-            app_logger.info(f"Resetting session {session_id[:8]}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Resetting session {session_id[:8]}")
 
             cleared_count = MessageRepository.clear_session_history(session_id)
             session.clear()
 
-            app_logger.info(f"Session reset completed - cleared {cleared_count} messages")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Session reset completed - cleared {cleared_count} messages")
             return response_service.success({
                 'messages_cleared': cleared_count
             }, "Session reset successfully")
@@ -167,7 +217,7 @@ class MainRoutes:
         """Get conversations for current user"""
         try:
             # For now, return empty conversations list
-            return response_service.success({'conversations': []})
+            return Response(_EMPTY_CONVERSATIONS_BODY, mimetype='application/json'), 200
         except Exception as e:
             return ErrorHandler.handle_error(
                 e,
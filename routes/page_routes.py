@@ -1,9 +1,11 @@
 """
 Page Rendering Routes Module
 """
+import logging
 from flask import render_template, session, flash, redirect, url_for
 from utils.logger import app_logger
-from functools import wraps  # Import wraps
+from services import user_profile_service
+from functools import wraps, partial  # Import wraps
 # Assuming get_user_by_id is defined elsewhere
 # from your_module import get_user_by_id
 
@@ -48,88 +50,51 @@ class PageRoutes:
 
     def register_routes(self, app):
         """Register page rendering routes"""
-        app.route('/', endpoint='index')(self.handle_index)
-        app.route('/blueprints', methods=['GET'])(self.handle_blueprints)
-        app.route('/toolshop', methods=['GET'])(self.handle_toolshop)
+        app.route('/', endpoint='index')(partial(self._render_with_user, 'index.html'))
+        app.route('/blueprints', methods=['GET'], endpoint='handle_blueprints')(partial(self._render_with_user, 'blueprints.html'))
+        app.route('/toolshop', methods=['GET'], endpoint='handle_toolshop')(partial(self._render_with_user, 'toolshop.html'))
         app.route('/dashboard')(self.dashboard)  # Add dashboard route
 
 
-    def handle_index(self):
-        """Main landing page"""
+    def _render_with_user(self, template_name):
+        """Render a page template with the complete user profile (index, blueprints, toolshop)"""
         user = session.get('user')
         if user:
             # Get complete user profile including profile picture
-            from routes.auth_routes import AuthRoutes
-            auth_handler = AuthRoutes()
-            user_profile = auth_handler.get_user_profile(user['id'])
+            user_profile = user_profile_service.get_profile(user['id'])
             if user_profile:
                 user.update(user_profile)
-        return render_template('index.html', user=user)
-
-    def handle_blueprints(self):
-        """Blueprints page"""
-        user = session.get('user')
-        if user:
-            # Get complete user profile including profile picture
-            from routes.auth_routes import AuthRoutes
-            auth_handler = AuthRoutes()
-            user_profile = auth_handler.get_user_profile(user['id'])
-            if user_profile:
-                user.update(user_profile)
-        return render_template('blueprints.html', user=user)
-
-    def handle_toolshop(self):
-        """Tool shop page"""
-        user = session.get('user')
-        if user:
-            # Get complete user profile including profile picture
-            from routes.auth_routes import AuthRoutes
-            auth_handler = AuthRoutes()
-            user_profile = auth_handler.get_user_profile(user['id'])
-            if user_profile:
-                user.update(user_profile)
-        return render_template('toolshop.html', user=user)
+        return render_template(template_name, user=user)
 
     @login_required
     def dashboard(self):
         """Dashboard page - main application interface"""
-        user_id = session.get('user')['id']
-        username = session.get('user')['username']
-        app_logger.info(f"Dashboard accessed by user: {username}")
+        session_user = session.get('user')
+        username = session_user['username']
+        if app_logger.isEnabledFor(logging.INFO):
+            app_logger.info(f"Dashboard accessed by user: {username}")
 
         # Get complete user profile including profile picture
-        from routes.auth_routes import AuthRoutes
-        auth_handler = AuthRoutes()
-        user_profile = auth_handler.get_user_profile(user_id)
-        
+        user_profile = user_profile_service.get_profile(session_user['id'])
+
         if not user_profile:
             flash('User session invalid. Please log in again.', 'error')
             return redirect(url_for('login'))
 
         # Start with session user data and update with profile data
-        user_info = session.get('user').copy()
-        user_info.update(user_profile)
-        
+        user_info = {**session_user, **user_profile}
+
         # Ensure all required fields are present
         if not user_info.get('username'):
             user_info['username'] = username
         if not user_info.get('first_name'):
             user_info['first_name'] = username
-            
-        # Debug log the user info to check profile picture
-        app_logger.info(f"Dashboard user profile data: {user_info}")
-        if user_info.get('profile_picture'):
-            app_logger.info(f"Profile picture URL: {user_info['profile_picture']}")
-        else:
-            app_logger.info("No profile picture found in user data")
 
         # Ensure profile picture is properly formatted for template
-        if user_info.get('profile_picture') and user_info['profile_picture'] != 'None':
-            # Make sure the profile picture URL is properly formatted
-            profile_pic = user_info['profile_picture']
-            if not profile_pic.startswith('/') and not profile_pic.startswith('http'):
-                user_info['profile_picture'] = f"/static/uploads/profile_pictures/{profile_pic}"
-        else:
+        profile_pic = user_info.get('profile_picture')
+        if not profile_pic or profile_pic == 'None':
             user_info['profile_picture'] = None
+        elif not profile_pic.startswith(('/', 'http')):
+            user_info['profile_picture'] = f"/static/uploads/profile_pictures/{profile_pic}"
 
         return render_template('dashboard.html', user=user_info)
\ No newline at end of file
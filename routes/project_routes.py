@@ -4,9 +4,9 @@ Project Management Routes Module
 from flask import request, jsonify, render_template, session
 from typing import Tuple, Dict, Any
 from datetime import datetime
-from database import DatabaseManager
+from database import db_manager
 from utils.logger import app_logger
-from services import response_service
+from services import response_service, project_service
 from utils.error_handler import ErrorHandler, ErrorCategories
 
 
@@ -14,7 +14,7 @@ class ProjectRoutes:
     """Project management route handlers"""
 
     def __init__(self):
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager
 
     def register_routes(self, app):
         """Register project management routes"""
@@ -579,6 +579,7 @@ class ProjectRoutes:
 
             # Delete project and related data
             success = self.db_manager.delete_project(project_id, user_id)
+            project_service.invalidate(project_id, user_id)
 
             if success:
                 # Verify deletion was complete
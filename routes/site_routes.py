@@ -3,25 +3,199 @@
 """The code adds the missing handle_project_builder method to the SiteRoutes class to resolve the "AttributeError: 'SiteRoutes' object has no attribute 'handle_project_builder'" error."""
 """The floorplan data is now only included in the site inspector if it's valid and from the current session, preventing the "file uploaded" message from appearing prematurely."""
 """Site Management Routes Module"""
-from flask import request, jsonify, render_template, session, redirect, url_for
+from flask import Response, current_app, request, jsonify, render_template, session, redirect, url_for
+import logging
 import time
-import json
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional, NamedTuple
 from auth import get_session_id
-from services import council_service, gradient_service, floorplan_service, property_service
+from services import (
+    council_service, gradient_service, floorplan_service, property_service, project_service,
+    edge_store_service, site_data_store_service
+)
 from utils.logger import app_logger
 from utils.site_validator import SiteValidator, BuildableAreaValidator, create_validation_response
 from utils.error_handler import (
     ErrorHandler, SiteInspectorError, ValidationError, GeometryError, 
     safe_execute, validate_request_data
 )
+from utils.json_utils import dumps_bytes, loads_bytes
+from services.response_service import JSON_HEADERS
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, wraps
+import hashlib
 import os
 
 
+GRADIENT_TIMEOUT_SECONDS = 30
+
+# Fields every save-edge-classifications payload must carry
+_EDGE_CLASSIFICATION_FIELDS = ('edgeClassifications', 'siteId')
+
+# Runs site inspector analyses that are independent of each other alongside the request thread
+_SITE_ANALYSIS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="SiteAnalysis")
+
+# The Mapbox token is fixed for the life of the process, so its response bodies are encoded once
+_MAPBOX_TOKEN = os.getenv('MAPBOX_ACCESS_TOKEN')
+_MAPBOX_OK_BODY = dumps_bytes({'success': True, 'token': _MAPBOX_TOKEN}) if _MAPBOX_TOKEN else None
+_MAPBOX_MISSING_BODY = dumps_bytes({'success': False, 'error': 'No Mapbox token configured', 'token': None})
+_MAPBOX_OK_ETAG = hashlib.blake2s(_MAPBOX_OK_BODY, digest_size=8).hexdigest() if _MAPBOX_OK_BODY else None
+MAPBOX_TOKEN_MAX_AGE = 300
+
+# Property boundary error bodies are constant per failure mode, so they are encoded once
+_ERR_COORDS_REQUIRED = dumps_bytes({'success': False, 'error': 'Latitude and longitude are required', 'properties': [], 'containing_property': None, 'total_count': 0})
+_ERR_COORDS_INVALID = dumps_bytes({'success': False, 'error': 'Invalid coordinates provided', 'properties': [], 'containing_property': None, 'total_count': 0})
+_ERR_PROPERTY_SERVICE_FAILED = dumps_bytes({'success': False, 'error': 'Property boundary service failed', 'properties': [], 'containing_property': None, 'total_count': 0})
+
+
+def _json_response(obj: Any, status: int = 200) -> Tuple[bytes, int, Dict[str, str]]:
+    """Encode a JSON response body directly, bypassing jsonify for large geometry payloads"""
+    return dumps_bytes(obj), status, JSON_HEADERS
+
+
+@lru_cache(maxsize=512)
+def _council_requirements(council_name: str, zoning: str) -> Dict[str, Any]:
+    """
+    Council requirements per (council, zoning), which are static configuration
+
+    The returned dict is shared between requests and must be treated as read-only.
+    """
+    return council_service.get_council_requirements(council_name, zoning)
+
+
+@lru_cache(maxsize=1)
+def _default_requirements() -> Dict[str, Any]:
+    """Industry-standard requirements, shared and read-only like _council_requirements"""
+    return council_service._get_default_requirements()
+
+
+def _edge_classifications_key(site_id: str) -> str:
+    """Session key under which a site's edge classifications are stored"""
+    return f'edge_classifications_{site_id}'
+
+
+def _normalize_project_id(raw: Optional[str]) -> Optional[int]:
+    """Parse a project id URL parameter, tolerating trailing junk such as 12?foo=bar or 12&x=y"""
+    if not raw:
+        return None
+    raw = raw.partition('?')[0].partition('&')[0]
+    # isdecimal() matches exactly the characters int() accepts, without raising on bad input
+    return int(raw) if raw.isdecimal() else None
+
+
+def _load_edge_state(key: str, default: Any) -> Any:
+    """Stored edge state for the current session, falling back to entries saved in the session cookie"""
+    value = edge_store_service.get((get_session_id(), key))
+    if value is None:
+        value = session.get(key, default)
+    return value
+
+
+def _load_site_data() -> Optional[Dict[str, Any]]:
+    """Stored site data for the current session, falling back to data saved in the session cookie"""
+    site_data = site_data_store_service.get(get_session_id())
+    if site_data is None:
+        site_data = session.get('site_data')
+    return site_data
+
+
+# Rendered HTML for pages whose templates take no context, keyed by template name
+_STATIC_PAGE_CACHE: Dict[str, bytes] = {}
+
+
+def _static_page(template_name: str) -> Response:
+    """Render a context-free page once and reuse its HTML, unless templates auto-reload"""
+    if current_app.templates_auto_reload:
+        return Response(render_template(template_name), mimetype='text/html')
+    body = _STATIC_PAGE_CACHE.get(template_name)
+    if body is None:
+        body = _STATIC_PAGE_CACHE[template_name] = render_template(template_name).encode()
+    return Response(body, mimetype='text/html')
+
+
+@lru_cache(maxsize=256)
+def _format_area(area: float) -> str:
+    """Human readable site area, in hectares above one hectare"""
+    return f"{(area / 10000):.2f} hectares" if area > 10000 else f"{area:.0f} m²"
+
+
+@lru_cache(maxsize=1)
+def _template_preview(path: str, mtime: float) -> str:
+    """First 200 characters of a template, re-read only when its mtime changes"""
+    with open(path, 'r') as f:
+        return f.read(200)
+
+
+def _conditional_json(body: bytes, etag: str, max_age: int = 0) -> Response:
+    """JSON response tagged with an ETag, sent as an empty 304 when the client's copy matches"""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.private = True
+    if max_age:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _json_errors(log_message: str):
+    """Log an unhandled handler exception and answer with a JSON 500 carrying its message"""
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(*args, **kwargs):
+            try:
+                return handler(*args, **kwargs)
+            except Exception as e:
+                app_logger.error(f"{log_message}: {e}")
+                return _json_response({'error': str(e)}, 500)
+        return wrapper
+    return decorator
+
+
+def _request_json() -> Any:
+    """Decode the JSON request body in one pass, or None if it is missing or malformed"""
+    if not request.is_json:
+        return None
+    try:
+        return loads_bytes(request.get_data(cache=False))
+    except ValueError:
+        return None
+
+
+class RouteSpec(NamedTuple):
+    """Static description of a site route"""
+    path: str
+    methods: Tuple[str, ...]
+    endpoint: str
+    handler_name: str
+    description: str
+    is_critical: bool
+
+
 class SiteRoutes:
     """Site management route handlers"""
 
+    # Stateless singleton: no instance dict, and handlers are static so requests skip method binding
+    __slots__ = ()
+
+    # Built once at class definition; handlers are resolved to plain functions at registration
+    _ROUTES: Tuple[RouteSpec, ...] = (
+        RouteSpec('/site-inspector', ('GET',), 'site_inspector', 'handle_site_inspector', 'Site inspection and analysis page', True),
+        RouteSpec('/api/calculate-buildable-area', ('POST',), 'calculate_buildable_area', 'handle_calculate_buildable_area', 'Buildable area calculation API', False),
+        RouteSpec('/api/save-edge-classifications', ('POST',), 'save_edge_classifications', 'handle_save_edge_classifications', 'Save edge classification data', False),
+        RouteSpec('/api/load-edge-classifications', ('GET',), 'load_edge_classifications', 'handle_load_edge_classifications', 'Load edge classification data', False),
+        RouteSpec('/api/save-edge-selection', ('POST',), 'save_edge_selection', 'handle_save_edge_selection', 'Save edge selection data', False),
+        RouteSpec('/api/load-edge-selection', ('GET',), 'load_edge_selection', 'handle_load_edge_selection', 'Load edge selection data', False),
+        RouteSpec('/api/site-status', ('GET',), 'get_site_status', 'handle_get_site_status', 'Get comprehensive site status', False),
+        RouteSpec('/test-navigation', ('GET',), 'test_navigation', 'handle_test_navigation', 'Test navigation functionality', False),
+        RouteSpec('/api/mapbox-token', ('GET',), 'get_mapbox_token', 'handle_get_mapbox_token', 'Get Mapbox access token', False),
+        RouteSpec('/api/debug-gradient', ('POST',), 'debug_gradient', 'handle_debug_gradient', 'Debug gradient calculation', False),
+        RouteSpec('/project-builder', ('GET',), 'project_builder', 'handle_project_builder', 'Project builder page', False),
+        RouteSpec('/structure-designer', ('GET',), 'structure_designer', 'handle_structure_designer', 'Structure designer page', False),
+        RouteSpec('/api/property-boundaries', ('POST',), 'get_property_boundaries', 'handle_get_property_boundaries', 'Get property boundaries for location', False),
+        RouteSpec('/api/get-saved-location', ('GET',), 'get_saved_location', 'handle_get_saved_location', 'Get saved location', False)
+    )
+
     def register_routes(self, app):
         """
         Register site management routes with comprehensive error handling.
@@ -36,56 +210,26 @@ class SiteRoutes:
         Raises:
             Exception: Only if critical routes fail to register
         """
-        routes_to_register = [
-            # (path, methods, endpoint, handler, description, critical)
-            ('/site-inspector', ['GET'], 'site_inspector', self.handle_site_inspector, 'Site inspection and analysis page', True),
-            ('/api/calculate-buildable-area', ['POST'], 'calculate_buildable_area', self.handle_calculate_buildable_area, 'Buildable area calculation API', False),
-            ('/api/save-edge-classifications', ['POST'], 'save_edge_classifications', self.handle_save_edge_classifications, 'Save edge classification data', False),
-            ('/api/load-edge-classifications', ['GET'], 'load_edge_classifications', self.handle_load_edge_classifications, 'Load edge classification data', False),
-            ('/api/save-edge-selection', ['POST'], 'save_edge_selection', self.handle_save_edge_selection, 'Save edge selection data', False),
-            ('/api/load-edge-selection', ['GET'], 'load_edge_selection', self.handle_load_edge_selection, 'Load edge selection data', False),
-            ('/api/site-status', ['GET'], 'get_site_status', self.handle_get_site_status, 'Get comprehensive site status', False),
-            ('/test-navigation', ['GET'], 'test_navigation', self.handle_test_navigation, 'Test navigation functionality', False),
-            ('/api/mapbox-token', ['GET'], 'get_mapbox_token', self.handle_get_mapbox_token, 'Get Mapbox access token', False),
-            ('/api/debug-gradient', ['POST'], 'debug_gradient', self.handle_debug_gradient, 'Debug gradient calculation', False),
-            ('/project-builder', ['GET'], 'project_builder', self.handle_project_builder, 'Project builder page', False),
-            ('/structure-designer', ['GET'], 'structure_designer', self.handle_structure_designer, 'Structure designer page', False),
-            ('/api/property-boundaries', ['POST'], 'get_property_boundaries', self.handle_get_property_boundaries, 'Get property boundaries for location', False),
-            ('/api/get-saved-location', ['GET'], 'get_saved_location', self.handle_get_saved_location, 'Get saved location', False)
-        ]
-
         registered_count = 0
         failed_routes = []
 
-        for path, methods, endpoint, handler, description, is_critical in routes_to_register:
+        for route in self._ROUTES:
             try:
-                app_logger.info(f"🔧 Registering route: {path} ({description})")
-
-                # Validate handler exists
-                if not callable(handler):
-                    raise AttributeError(f"Handler {handler.__name__ if hasattr(handler, '__name__') else handler} is not callable")
-
-                # Register the route
-                app.route(path, methods=methods, endpoint=endpoint)(handler)
-
+                app.add_url_rule(route.path, route.endpoint, getattr(self, route.handler_name), methods=route.methods)
                 registered_count += 1
-                app_logger.info(f"✅ Successfully registered: {path}")
 
             except Exception as e:
-                error_msg = f"Failed to register {path}: {e}"
+                error_msg = f"Failed to register {route.path} ({route.description}): {e}"
                 app_logger.error(error_msg)
-                failed_routes.append((path, error_msg))
+                failed_routes.append((route.path, error_msg))
 
                 # If this is a critical route, we might want to raise
-                if is_critical:
-                    app_logger.critical(f"🚨 Critical route {path} failed to register: {e}")
+                if route.is_critical:
+                    app_logger.critical(f"🚨 Critical route {route.path} failed to register: {e}")
                     # Continue for now, but log as critical
 
         # Summary logging
-        total_routes = len(routes_to_register)
-        app_logger.info(f"📊 Site routes registration summary:")
-        app_logger.info(f"   ✅ Registered: {registered_count}/{total_routes}")
-        app_logger.info(f"   ❌ Failed: {len(failed_routes)}")
+        app_logger.info(f"📊 Site routes registered: {registered_count}/{len(self._ROUTES)}, failed: {len(failed_routes)}")
 
         if failed_routes:
             app_logger.warning("Failed routes:")
@@ -96,124 +240,75 @@ class SiteRoutes:
         if registered_count == 0:
             raise Exception("No site routes could be registered - site functionality will be unavailable")
 
-    def handle_test_navigation(self):
+    @staticmethod
+    def handle_test_navigation():
         """Test route to verify navigation is working"""
         app_logger.info("Test navigation route accessed successfully")
 
         # Test template rendering capability
-        template_test = "Template rendering not tested"
         try:
             from flask import current_app
-            import os
             template_dir = current_app.template_folder
             map_template_path = os.path.join(template_dir, 'map.html')
-            template_test = f"Template directory: {template_dir}<br>"
-            template_test += f"map.html exists: {os.path.exists(map_template_path)}<br>"
-            if os.path.exists(map_template_path):
-                with open(map_template_path, 'r') as f:
-                    content_preview = f.read()[:200]
-                template_test += f"Template content preview: {content_preview}..."
+            map_exists = os.path.exists(map_template_path)
+            preview = _template_preview(map_template_path, os.path.getmtime(map_template_path)) if map_exists else ''
+            return render_template('test_navigation.html',
+                                   template_dir=template_dir,
+                                   map_exists=map_exists,
+                                   preview=preview)
         except Exception as e:
-            template_test = f"Template test failed: {e}"
-
-        return f"""
-        <html>
-        <head><title>Navigation Test</title></head>
-        <body>
-            <h1>Navigation Working!</h1>
-            <p>If you can see this, navigation is working.</p>
-            <p><strong>Template Test Results:</strong></p>
-            <p>{template_test}</p>
-            <p><a href="/">Back to Home</a></p>
-            <p><a href="/site-selection">Try Site Selection</a></p>
-            <script>
-                console.log('Test navigation page loaded successfully');
-                console.log('Testing site-selection route...');
-                fetch('/site-selection', {{ method: 'HEAD' }})
-                    .then(response => {{
-                        console.log('Site selection route test:', response.status, response.statusText);
-                    }})
-                    .catch(error => {{
-                        console.error('Site selection route test failed:', error);
-                    }});
-            </script>
-        </body>
-        </html>
-        """
-
-
+            return render_template('test_navigation.html', error=e)
 
-    def handle_site_inspector(self):
+    @staticmethod
+    def handle_site_inspector():
         """Handle Site Inspector page with comprehensive error handling"""
+        # Session writes are collected here and applied once per request
+        session_updates = {}
         try:
             # Get project information from URL parameters
-            project_id = request.args.get('project') or request.args.get('project_id')
+            args = request.args
+            raw_project_id = args.get('project') or args.get('project_id')
 
             # Debug logging for URL parameters
-            app_logger.info(f"Site inspector request - URL: {request.url}")
-            app_logger.info(f"Site inspector request - Args: {dict(request.args)}")
-            app_logger.info(f"Site inspector request - Project ID: {project_id}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Site inspector request - URL: {request.url}, Project ID: {raw_project_id}")
+            if app_logger.isEnabledFor(logging.DEBUG):
+                app_logger.debug(f"Site inspector request - Args: {dict(args)}")
 
-            # Clean up malformed project IDs early in the process
-            if project_id and ('?' in str(project_id) or '&' in str(project_id)):
-                project_id = str(project_id).split('?')[0].split('&')[0]
-                app_logger.info(f"Cleaned malformed project ID early: {project_id}")
+            project_id = _normalize_project_id(raw_project_id)
+            if raw_project_id and project_id is None:
+                app_logger.warning(f"Invalid project ID format: {raw_project_id}")
 
             project_data = {}
+            user_id = session.get('user', {}).get('id')
 
-            if project_id:
+            if project_id and user_id:
                 try:
-                    # Clean up malformed project IDs
-                    if '?' in str(project_id):
-                        project_id = str(project_id).split('?')[0]
-
-                    # Validate project ID is numeric
-                    try:
-                        project_id = int(project_id)
-                    except (ValueError, TypeError):
-                        app_logger.warning(f"Invalid project ID format: {project_id}")
-                        project_id = None
-                        project_data = {}
-
-                    if project_id:
-                        from database import DatabaseManager
-                        db_manager = DatabaseManager()
-                        user_id = session.get('user', {}).get('id')
-
-                        if user_id:
-                            with db_manager.db.get_cursor() as cursor:
-                                cursor.execute('''
-                                    SELECT name, address, location_lat, location_lng
-                                    FROM projects 
-                                    WHERE id = ? AND user_id = ?
-                                ''', (project_id, user_id))
-
-                                project_row = cursor.fetchone()
-                                if project_row:
-                                    project_data = {
-                                        'id': project_id,
-                                        'name': project_row[0],
-                                        'address': project_row[1],
-                                        'location_lat': project_row[2],
-                                        'location_lng': project_row[3]
-                                    }
-                                    app_logger.info(f"Retrieved project data: {project_data['name']} at {project_data['address']} (ID: {project_id})")
-
-                                    # Store project info in session for JavaScript access
-                                    session['current_project_id'] = project_id
-                                    session['current_project_name'] = project_data['name']
-                                    session['current_project_address'] = project_data['address']
+                    project_row = project_service.get_project_summary(project_id, user_id)
+                    if project_row:
+                        project_data = project_row
+                        if app_logger.isEnabledFor(logging.INFO):
+                            app_logger.info(f"Retrieved project data: {project_data['name']} at {project_data['address']} (ID: {project_id})")
+
+                        # Store project info in session for JavaScript access
+                        session_updates.update({
+                            'current_project_id': project_id,
+                            'current_project_name': project_data['name'],
+                            'current_project_address': project_data['address']
+                        })
                 except Exception as e:
                     app_logger.error(f"Failed to retrieve project data: {e}")
 
             # Enhanced session data validation
-            site_data = session.get('site_data')
+            site_data = _load_site_data()
             if not site_data:
-                app_logger.info("No site data in session, loading site inspector for new polygon creation", {
-                    'session_keys': list(session.keys()),
-                    'user_agent': request.headers.get('User-Agent', 'Unknown'),
-                    'referer': request.headers.get('Referer', 'None')
-                })
+                if app_logger.isEnabledFor(logging.INFO):
+                    headers = request.headers
+                    app_logger.info("No site data in session, loading site inspector for new polygon creation", {
+                        'session_keys': list(session.keys()),
+                        'user_agent': headers.get('User-Agent', 'Unknown'),
+                        'referer': headers.get('Referer', 'None')
+                    })
                 # Provide minimal site data structure for new polygon creation
                 site_data = {
                     'area': 0,
@@ -224,13 +319,15 @@ class SiteRoutes:
                     'ready_for_new_polygon': True
                 }
 
-            app_logger.info("Processing site inspector request", {
-                'site_data_keys': list(site_data.keys()) if site_data else [],
-                'has_coordinates': bool(site_data.get('coordinates')),
-                'coordinate_count': len(site_data.get('coordinates', [{}])[0]) if site_data.get('coordinates') else 0,
-                'has_center': bool(site_data.get('center')),
-                'area': site_data.get('area', 'unknown')
-            })
+            if app_logger.isEnabledFor(logging.INFO):
+                coordinates = site_data.get('coordinates')
+                app_logger.info("Processing site inspector request", {
+                    'site_data_keys': list(site_data),
+                    'has_coordinates': bool(coordinates),
+                    'coordinate_count': len(coordinates[0]) if coordinates else 0,
+                    'has_center': bool(site_data.get('center')),
+                    'area': site_data.get('area', 'unknown')
+                })
 
             # Enhanced site data validation
             site_valid, site_errors = SiteValidator.validate_site_data(site_data)
@@ -255,45 +352,44 @@ class SiteRoutes:
                     if error_message:
                         return render_template('site_inspector.html', 
                                              site_data={'error': error_message},
-                                             site_data_json=json.dumps({'error': True, 'message': error_message}),
+                                             site_data_json=dumps_bytes({'error': True, 'message': error_message}).decode('utf-8'),
                                              area_text="Error: Invalid site data",
                                              validation_errors=site_errors,
                                              project_data=project_data if project_data else {},
                                              project_id=project_id)
 
-            # Use services to enhance site data
-            enhanced_site_data = site_data.copy() if site_data else {}
-            app_logger.info(f"Processing site inspector for area: {site_data.get('area', 'unknown')} m²")
+            # Use services to enhance site data. The copy is shallow: only the top-level keys are
+            # duplicated so the session's dict is not mutated, coordinate lists are shared.
+            enhanced_site_data = dict(site_data)
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Processing site inspector for area: {site_data.get('area', 'unknown')} m²")
 
-            # Calculate gradient data with error handling
-            try:
-                gradient_data = gradient_service.calculate_gradient_data(site_data)
-                enhanced_site_data.update(gradient_data)
-                app_logger.info("Gradient data calculated successfully")
-            except Exception as e:
-                app_logger.error(f"Gradient calculation failed: {e}")
-                enhanced_site_data['gradient_error'] = str(e)
+            # Calculate gradient data in the background, it is independent of the buildable area below
+            gradient_future = _SITE_ANALYSIS_EXECUTOR.submit(gradient_service.calculate_gradient_data, site_data)
 
             # Get council requirements and calculate buildable area
             council_name = enhanced_site_data.get('council', '')
             zoning = enhanced_site_data.get('zoning', 'residential')
 
             if council_name:
-                app_logger.info(f"Looking up requirements for {council_name}, zoning: {zoning}")
+                if app_logger.isEnabledFor(logging.INFO):
+                    app_logger.info(f"Looking up requirements for {council_name}, zoning: {zoning}")
                 try:
-                    council_requirements = council_service.get_council_requirements(council_name, zoning)
+                    council_requirements = _council_requirements(council_name, zoning)
                     enhanced_site_data['council_requirements'] = council_requirements
-                    app_logger.info(f"Council requirements loaded: {list(council_requirements.keys()) if council_requirements else 'None'}")
+                    if app_logger.isEnabledFor(logging.INFO):
+                        app_logger.info(f"Council requirements loaded: {list(council_requirements.keys()) if council_requirements else 'None'}")
 
                     # Calculate buildable area with proper error handling
                     coordinates = enhanced_site_data.get('coordinates', [])
                     if coordinates and len(coordinates) > 0:
                         coords_to_use = coordinates[0] if isinstance(coordinates[0], list) else coordinates
-                        app_logger.info(f"Calculating buildable area for {len(coords_to_use)} coordinate points")
+                        if app_logger.isEnabledFor(logging.INFO):
+                            app_logger.info(f"Calculating buildable area for {len(coords_to_use)} coordinate points")
 
-                        # Check for edge classifications in session
+                        # Check for stored edge classifications
                         session_id = get_session_id()
-                        edge_classifications = session.get(f'edge_classifications_{session_id}', [])
+                        edge_classifications = _load_edge_state(_edge_classifications_key(session_id), ())
 
                         # If no edge classifications, try a fallback frontage
                         frontage = 'north' if not edge_classifications else None
@@ -321,7 +417,8 @@ class SiteRoutes:
                                     enhanced_site_data['buildable_area'] = buildable_data
                                     buildable_area_m2 = buildable_data.get('buildable_area_m2', 0)
                                     if buildable_area_m2 > 0:
-                                        app_logger.info(f"Calculated buildable area: {buildable_area_m2:.1f} m²")
+                                        if app_logger.isEnabledFor(logging.INFO):
+                                            app_logger.info(f"Calculated buildable area: {buildable_area_m2:.1f} m²")
                                     else:
                                         app_logger.warning(f"Buildable area calculation resulted in 0 m². Errors: {result_errors}")
                                 else:
@@ -348,20 +445,30 @@ class SiteRoutes:
                 app_logger.warning("No council name available for requirements lookup")
                 enhanced_site_data['buildable_area'] = {'error': 'No council information available', 'buildable_area_m2': 0}
 
+            # Collect gradient data with error handling
+            try:
+                gradient_data = gradient_future.result(timeout=GRADIENT_TIMEOUT_SECONDS)
+                enhanced_site_data.update(gradient_data)
+                app_logger.info("Gradient data calculated successfully")
+            except Exception as e:
+                app_logger.error(f"Gradient calculation failed: {e}")
+                enhanced_site_data['gradient_error'] = str(e)
+
             # Check for existing floor plan data (only if it's from current session)
             floorplan_data = session.get('floorplan_data')
             # Only include floorplan data if it has been properly processed and has boundaries
             if floorplan_data and floorplan_data.get('success') and floorplan_data.get('boundaries'):
                 site_data['floorplan_data'] = floorplan_data
-                app_logger.info(f"Floor plan data available: {len(floorplan_data.get('boundaries', []))} boundary points")
+                if app_logger.isEnabledFor(logging.INFO):
+                    app_logger.info(f"Floor plan data available: {len(floorplan_data.get('boundaries', []))} boundary points")
             else:
                 # Clear any stale or incomplete floorplan data
-                if 'floorplan_data' in session:
-                    del session['floorplan_data']
+                if floorplan_data is not None:
+                    session.pop('floorplan_data', None)
 
             # Calculate area text for display
             area = enhanced_site_data.get('area', 0)
-            area_text = f"{(area / 10000):.2f} hectares" if area > 10000 else f"{area:.0f} m²"
+            area_text = _format_area(area)
 
             # Include lock status in the data passed to template
             enhanced_site_data['isLocked'] = session.get('site_locked', False)
@@ -369,18 +476,23 @@ class SiteRoutes:
 
             # Store current project ID in session for other tools
             if project_id:
-                session['current_project_id'] = project_id
+                session_updates['current_project_id'] = project_id
 
-            # Pass the site data to the template, including the JSON version for JavaScript
+            # Apply all session writes for this request at once
+            if session_updates:
+                session.update(session_updates)
+
+            # Pass the site data to the template, which embeds it for JavaScript with |tojson
             return render_template('site_inspector.html', 
                                  site_data=enhanced_site_data,
-                                 site_data_json=json.dumps(enhanced_site_data),
                                  area_text=area_text,
                                  project_data=project_data,
                                  project_id=project_id)
 
         except Exception as e:
             app_logger.error(f"Site inspector error: {e}")
+            if session_updates:
+                session.update(session_updates)
             # Return error page or redirect with error message
             return render_template('site_inspector.html', 
                                  site_data={'error': str(e)},
@@ -389,21 +501,19 @@ class SiteRoutes:
                                  project_data=project_data if 'project_data' in locals() and project_data else {},
                                  project_id=project_id if 'project_id' in locals() else None)
 
-    def handle_calculate_buildable_area(self):
+    @staticmethod
+    def handle_calculate_buildable_area():
         """Calculate buildable area with specific frontage configuration"""
         try:
-            print(f"[SiteRoutes] Buildable area calculation requested")
-
             # Validate request data
-            data = request.get_json()
-            print(f"[SiteRoutes] Request data keys: {list(data.keys()) if data else 'None'}")
+            data = _request_json()
 
             # Check if we have site_coords at minimum
             if not data or 'site_coords' not in data:
                 error_response = ErrorHandler.handle_buildable_area_error(
                     ValidationError("Site coordinates are required"), data
                 )
-                return jsonify(error_response), 400
+                return _json_response(error_response, 400)
 
             site_coords = data.get('site_coords')
             requirements = data.get('requirements')
@@ -412,28 +522,26 @@ class SiteRoutes:
 
             # If no requirements provided, try to get them from session/site data
             if not requirements:
-                site_data = session.get('site_data', {})
+                site_data = _load_site_data() or {}
                 council_name = site_data.get('council', '')
                 zoning = site_data.get('zoning', 'residential')
 
                 if council_name:
-                    app_logger.info(f"Getting requirements for {council_name}, zoning: {zoning}")
-                    requirements = council_service.get_council_requirements(council_name, zoning)
-                    app_logger.info(f"Retrieved requirements: {bool(requirements)}")
+                    if app_logger.isEnabledFor(logging.INFO):
+                        app_logger.info(f"Getting requirements for {council_name}, zoning: {zoning}")
+                    requirements = _council_requirements(council_name, zoning)
+                    if app_logger.isEnabledFor(logging.INFO):
+                        app_logger.info(f"Retrieved requirements: {bool(requirements)}")
                 else:
                     app_logger.warning("No council data available, using default requirements")
-                    requirements = council_service._get_default_requirements()
+                    requirements = _default_requirements()
 
             # Validate we now have requirements
             if not requirements:
                 error_response = ErrorHandler.handle_buildable_area_error(
                     ValidationError("Council requirements could not be determined"), data
                 )
-                return jsonify(error_response), 400
-
-            print(f"[SiteRoutes] Inputs - coords: {len(site_coords) if site_coords else 0}, frontage: {frontage}")
-            print(f"[SiteRoutes] Requirements: {requirements}")
-            print(f"[SiteRoutes] Edge classifications: {len(edge_classifications) if edge_classifications else 0}")
+                return _json_response(error_response, 400)
 
             # Validate inputs
             inputs_valid, input_errors = BuildableAreaValidator.validate_buildable_area_inputs(
@@ -445,18 +553,15 @@ class SiteRoutes:
                     ValidationError(f"Invalid inputs: {'; '.join(input_errors)}"),
                     data
                 )
-                return jsonify(error_response), 400
+                return _json_response(error_response, 400)
 
             # Perform calculation with error handling
-            result, error = safe_execute(
-                council_service.calculate_buildable_area,
-                site_coords, requirements, frontage, edge_classifications,
-                error_handler=ErrorHandler.handle_buildable_area_error,
-                context=data
-            )
-
-            if error:
-                return jsonify(error), 500
+            try:
+                result = council_service.calculate_buildable_area(
+                    site_coords, requirements, frontage, edge_classifications
+                )
+            except Exception as e:
+                return _json_response(ErrorHandler.handle_buildable_area_error(e, data), 500)
 
             # Validate result
             result_valid, result_errors = BuildableAreaValidator.validate_buildable_area_result(result)
@@ -466,7 +571,8 @@ class SiteRoutes:
 
             calculation_method = result.get('calculation_method', 'unknown')
             buildable_area = result.get('buildable_area_m2', 0)
-            app_logger.info(f"Recalculated buildable area with method {calculation_method}: {buildable_area:.1f} m²")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Recalculated buildable area with method {calculation_method}: {buildable_area:.1f} m²")
 
             # Log user action
             ErrorHandler.log_user_action(
@@ -480,36 +586,47 @@ class SiteRoutes:
                 }
             )
 
-            return jsonify(result), 200
+            return _json_response(result, 200)
 
         except Exception as e:
             app_logger.error(f"Buildable area calculation error: {e}")
             error_response = ErrorHandler.handle_buildable_area_error(e, data if 'data' in locals() else None)
-            return jsonify(error_response), 500
+            return _json_response(error_response, 500)
 
-    def handle_save_edge_classifications(self):
+    @staticmethod
+    def handle_save_edge_classifications():
         """Save edge classifications for a site"""
         try:
             # Validate request data
-            data = request.get_json()
+            data = _request_json()
             if not data:
                 error_response = ErrorHandler.handle_edge_classification_error(
                     ValidationError("No JSON data received")
                 )
-                return jsonify(error_response), 400
+                return _json_response(error_response, 400)
 
-            validation_error = validate_request_data(data, ['edgeClassifications', 'siteId'])
+            validation_error = validate_request_data(data, _EDGE_CLASSIFICATION_FIELDS)
             if validation_error:
                 error_response = ErrorHandler.handle_edge_classification_error(validation_error, data)
-                return jsonify(error_response), validation_error.status_code
+                return _json_response(error_response, validation_error.status_code)
 
             edge_classifications = data.get('edgeClassifications', [])
             site_id = data.get('siteId', 'unknown')
 
-            app_logger.info(f"Processing {len(edge_classifications)} edge classifications for site {site_id}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Processing {len(edge_classifications)} edge classifications for site {site_id}")
 
-            # Filter out unclassified edges (those with None type) before validation
-            classified_edges = [edge for edge in edge_classifications if edge.get('type') is not None]
+            # Single pass: pick out classified edges for validation, normalize legacy
+            # 'classification' keys on unclassified ones and collect types for logging
+            classified_edges = []
+            edge_types = []
+            for edge in edge_classifications:
+                edge_type = edge.get('type')
+                if edge_type is not None:
+                    classified_edges.append(edge)
+                elif 'type' not in edge and 'classification' in edge:
+                    edge_type = edge['type'] = edge['classification']
+                edge_types.append(edge_type)
 
             # Only validate if we have classified edges
             if classified_edges:
@@ -519,17 +636,13 @@ class SiteRoutes:
                         ValidationError(f"Invalid edge classifications: {'; '.join(edge_errors)}"),
                         edge_classifications
                     )
-                    return jsonify(error_response), 400
+                    return _json_response(error_response, 400)
 
-            # Normalize edge classifications
-            for edge in edge_classifications:
-                if 'type' not in edge and 'classification' in edge:
-                    edge['type'] = edge['classification']
-
-            # Store in session (could be enhanced to use database)
-            session[f'edge_classifications_{site_id}'] = edge_classifications
+            # Store server-side rather than in the session cookie
+            edge_store_service.set((get_session_id(), _edge_classifications_key(site_id)), edge_classifications)
 
-            app_logger.info(f"Successfully saved edge classifications for site {site_id}: {len(edge_classifications)} edges")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Successfully saved edge classifications for site {site_id}: {len(edge_classifications)} edges")
 
             # Log user action
             ErrorHandler.log_user_action(
@@ -538,7 +651,7 @@ class SiteRoutes:
                 {
                     'site_id': site_id,
                     'edge_count': len(edge_classifications),
-                    'edge_types': [edge.get('type') for edge in edge_classifications]
+                    'edge_types': edge_types
                 }
             )
 
@@ -546,125 +659,117 @@ class SiteRoutes:
                 {'edge_count': len(edge_classifications)},
                 'Edge classifications saved successfully'
             )
-            return jsonify(response), 200
+            return _json_response(response, 200)
 
         except Exception as e:
             app_logger.error(f"Error saving edge classifications: {e}")
             error_response = ErrorHandler.handle_edge_classification_error(e, data if 'data' in locals() else None)
-            return jsonify(error_response), 500
+            return _json_response(error_response, 500)
 
-    def handle_load_edge_classifications(self):
+    @staticmethod
+    @_json_errors("Error loading edge classifications")
+    def handle_load_edge_classifications():
         """Load edge classifications for a site"""
-        try:
-            site_id = request.args.get('siteId', 'unknown')
-            edge_classifications = session.get(f'edge_classifications_{site_id}', [])
+        site_id = request.args.get('siteId', 'unknown')
+        edge_classifications = _load_edge_state(_edge_classifications_key(site_id), ())
 
-            return jsonify({
-                'success': True, 
-                'edge_classifications': edge_classifications
-            }), 200
-
-        except Exception as e:
-            app_logger.error(f"Error loading edge classifications: {e}")
-            return jsonify({'error': str(e)}), 500
+        return _json_response({
+            'success': True, 
+            'edge_classifications': edge_classifications
+        })
 
-    def handle_save_edge_selection(self):
+    @staticmethod
+    @_json_errors("Error saving edge selection")
+    def handle_save_edge_selection():
         """Save edge selection for a site"""
-        try:
-            data = request.get_json()
-            selected_edges = data.get('selectedEdges', [])
-            site_id = data.get('siteId', 'unknown')
+        data = _request_json() or {}
+        selected_edges = data.get('selectedEdges', [])
+        site_id = data.get('siteId', 'unknown')
 
-            # Store in session for now
-            session[f'edge_selection_{site_id}'] = {
-                'selectedEdges': selected_edges,
-                'timestamp': data.get('timestamp', None)
-            }
+        # Store server-side rather than in the session cookie
+        edge_store_service.set((get_session_id(), f'edge_selection_{site_id}'), {
+            'selectedEdges': selected_edges,
+            'timestamp': data.get('timestamp', None)
+        })
 
+        if app_logger.isEnabledFor(logging.INFO):
             app_logger.info(f"Saved edge selection for site {site_id}: {len(selected_edges)} edges")
 
-            return jsonify({'success': True, 'message': 'Edge selection saved'}), 200
-
-        except Exception as e:
-            app_logger.error(f"Error saving edge selection: {e}")
-            return jsonify({'error': str(e)}), 500
+        return jsonify({'success': True, 'message': 'Edge selection saved'}), 200
 
-    def handle_load_edge_selection(self):
+    @staticmethod
+    @_json_errors("Error loading edge selection")
+    def handle_load_edge_selection():
         """Load edge selection for a site"""
-        try:
-            site_id = request.args.get('siteId', 'unknown')
-            edge_selection = session.get(f'edge_selection_{site_id}', {})
-
-            return jsonify({
-                'success': True, 
-                'selectedEdges': edge_selection.get('selectedEdges', []),
-                'timestamp': edge_selection.get('timestamp', None)
-            }), 200
-
-        except Exception as e:
-            app_logger.error(f"Error loading edge selection: {e}")
-            return jsonify({'error': str(e)}), 500
-
-    def handle_get_site_status(self):
+        site_id = request.args.get('siteId', 'unknown')
+        edge_selection = _load_edge_state(f'edge_selection_{site_id}', {})
+
+        return jsonify({
+            'success': True, 
+            'selectedEdges': edge_selection.get('selectedEdges', []),
+            'timestamp': edge_selection.get('timestamp', None)
+        }), 200
+
+    @staticmethod
+    @_json_errors("Error getting site status")
+    def handle_get_site_status():
         """Get comprehensive site status including floor plan and buildable area"""
-        try:
-            site_data = session.get('site_data', {})
-            floorplan_data = session.get('floorplan_data', {})
-
-            # Check buildable area status
-            buildable_area = site_data.get('buildable_area', {})
-
-            # Prepare status response
-            status = {
-                'site_selected': session.get('site_selected', False),
-                'has_site_data': bool(site_data),
-                'has_floorplan': bool(floorplan_data.get('success')),
-                'has_buildable_area': bool(buildable_area.get('buildable_area_m2')),
-                'buildable_area_m2': buildable_area.get('buildable_area_m2', 0),
-                'site_area': site_data.get('area', 0),
-                'location': session.get('user_location', ''),
-                'council': site_data.get('council', ''),
-                'zoning': site_data.get('zoning', '')
-            }
-
-            return jsonify({'success': True, 'status': status}), 200
-
-        except Exception as e:
-            app_logger.error(f"Error getting site status: {e}")
-            return jsonify({'error': str(e)}), 500
-
-    def handle_get_mapbox_token(self):
+        site_data = _load_site_data() or {}
+        floorplan_data = session.get('floorplan_data') or {}
+
+        # Check buildable area status
+        buildable_area = site_data.get('buildable_area') or {}
+        buildable_area_m2 = buildable_area.get('buildable_area_m2', 0)
+
+        # Prepare status response
+        status = {
+            'site_selected': session.get('site_selected', False),
+            'has_site_data': bool(site_data),
+            'has_floorplan': bool(floorplan_data.get('success')),
+            'has_buildable_area': bool(buildable_area_m2),
+            'buildable_area_m2': buildable_area_m2,
+            'site_area': site_data.get('area', 0),
+            'location': session.get('user_location', ''),
+            'council': site_data.get('council', ''),
+            'zoning': site_data.get('zoning', '')
+        }
+
+        return _json_response({'success': True, 'status': status})
+
+    @staticmethod
+    def handle_get_mapbox_token():
         """Get Mapbox access token"""
         try:
-            import os
-            token = os.getenv('MAPBOX_ACCESS_TOKEN')
-            if token:
-                return jsonify({'success': True, 'token': token}), 200
+            if _MAPBOX_OK_BODY is not None:
+                return _conditional_json(_MAPBOX_OK_BODY, _MAPBOX_OK_ETAG, MAPBOX_TOKEN_MAX_AGE)
             else:
                 app_logger.error("No Mapbox token found in environment variables")
-                return jsonify({'success': False, 'error': 'No Mapbox token configured', 'token': None}), 200
+                return _MAPBOX_MISSING_BODY, 200, JSON_HEADERS
         except Exception as e:
             app_logger.error(f"Error getting Mapbox token: {e}")
             return jsonify({'success': False, 'error': str(e), 'token': None}), 500
 
-    def handle_debug_gradient(self):
+    @staticmethod
+    @_json_errors("Debug gradient error")
+    def handle_debug_gradient():
         """Debug gradient calculation"""
-        try:
-            data = request.get_json()
+        data = _request_json()
 
+        if app_logger.isEnabledFor(logging.INFO):
             app_logger.info(f"Gradient debug request received with keys: {list(data.keys()) if data else 'None'}")
 
-            if not data:
-                return jsonify({
-                    'success': False,
-                    'error': 'No data provided for gradient debugging'
-                }), 400
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No data provided for gradient debugging'
+            }), 400
 
-            # Detailed input validation and logging
-            coordinates = data.get('coordinates', [])
-            if coordinates and isinstance(coordinates[0], list):
-                coordinates = coordinates[0]
+        # Detailed input validation and logging
+        coordinates = data.get('coordinates', [])
+        if coordinates and isinstance(coordinates[0], list):
+            coordinates = coordinates[0]
 
+        if app_logger.isEnabledFor(logging.INFO):
             input_summary = {
                 'has_coordinates': bool(data.get('coordinates')),
                 'coordinate_count': len(coordinates) if coordinates else 0,
@@ -678,100 +783,89 @@ class SiteRoutes:
             }
             app_logger.info(f"Input data validation: {input_summary}")
 
-            # Continue with gradient calculation logic here
-            result = gradient_service.debug_gradient_calculation(data)
+        # Continue with gradient calculation logic here
+        result = gradient_service.debug_gradient_calculation(data)
 
-            app_logger.info(f"Debug gradient request: {data}")
+        if app_logger.isEnabledFor(logging.DEBUG):
+            app_logger.debug(f"Debug gradient request: {data}")
 
-            # Return debug info
+        # Return debug info
 
-            return jsonify({
-                'success': True,
-                'debug_info': 'Gradient debug endpoint working'
-            }), 200
-        except Exception as e:
-            app_logger.error(f"Debug gradient error: {e}")
-            return jsonify({'error': str(e)}), 500
+        return jsonify({
+            'success': True,
+            'debug_info': 'Gradient debug endpoint working'
+        }), 200
 
-    def handle_project_builder(self):
+    @staticmethod
+    def handle_project_builder():
         """Handle project builder page"""
         try:
             app_logger.info("Project builder page requested")
-            return render_template('project_builder.html')
+            return _static_page('project_builder.html')
         except Exception as e:
             app_logger.error(f"Project builder error: {e}")
             return f"Error loading project builder: {e}", 500
 
-    def handle_structure_designer(self):
+    @staticmethod
+    def handle_structure_designer():
         """Handle structure designer page"""
         try:
             app_logger.info("Structure designer page requested")
-            return render_template('structure_designer.html')
+            return _static_page('structure_designer.html')
         except Exception as e:
             app_logger.error(f"Structure designer error: {e}")
             return render_template('structure_designer.html', 
                                  site_data={'error': str(e)},
                                  site_data_json='{}'), 500
 
-    def handle_get_property_boundaries(self):
+    @staticmethod
+    def handle_get_property_boundaries():
         """Get property boundaries for location"""
         try:
-            data = request.get_json()
-            app_logger.info(f"Property boundaries request: {data}")
+            data = _request_json()
+            if app_logger.isEnabledFor(logging.DEBUG):
+                app_logger.debug(f"Property boundaries request: {data}")
 
-            if not data or ('lat' not in data or 'lng' not in data):
-                return jsonify({
-                    'success': False,
-                    'error': 'Latitude and longitude are required',
-                    'properties': [],
-                    'containing_property': None,
-                    'total_count': 0
-                }), 400
+            lat = data.get('lat') if data else None
+            lng = data.get('lng') if data else None
+            if lat is None or lng is None:
+                return _ERR_COORDS_REQUIRED, 400, JSON_HEADERS
 
-            lat = float(data['lat'])
-            lng = float(data['lng'])
+            # orjson already yields floats for JSON numbers, only other types need converting
+            if type(lat) is not float:
+                lat = float(lat)
+            if type(lng) is not float:
+                lng = float(lng)
 
             # Use the property service to get only the containing property
-            from services.property_service import property_service
             result = property_service.get_containing_property_only(lat, lng)
 
-            app_logger.info(f"Property boundaries result: {result.get('success', False)}, {result.get('total_count', 0)} properties")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Property boundaries result: {result.get('success', False)}, {result.get('total_count', 0)} properties")
 
-            return jsonify(result), 200
+            return _json_response(result)
 
         except (ValueError, TypeError) as e:
             app_logger.error(f"Invalid coordinates in property boundaries request: {e}")
-            return jsonify({
-                'success': False,
-                'error': 'Invalid coordinates provided',
-                'properties': [],
-                'containing_property': None,
-                'total_count': 0
-            }), 400
+            return _ERR_COORDS_INVALID, 400, JSON_HEADERS
         except Exception as e:
             app_logger.error(f"Property boundaries error: {e}")
-            return jsonify({
-                'success': False,
-                'error': 'Property boundary service failed',
-                'properties': [],
-                'containing_property': None,
-                'total_count': 0
-            }), 500
+            return _ERR_PROPERTY_SERVICE_FAILED, 500, JSON_HEADERS
 
-    def handle_get_saved_location(self):
+    @staticmethod
+    @_json_errors("Get saved location error")
+    def handle_get_saved_location():
         """Get saved location"""
-        try:
-            location = session.get('user_location', '')
-            location_data = session.get('location_data', {})
-
-            return jsonify({
-                'success': True,
-                'location': location,
-                'location_data': location_data
-            }), 200
-        except Exception as e:
-            app_logger.error(f"Get saved location error: {e}")
-            return jsonify({'error': str(e)}), 500
+        location = session.get('user_location', '')
+        location_data = session.get('location_data', {})
+
+        body = dumps_bytes({
+            'success': True,
+            'location': location,
+            'location_data': location_data
+        })
+        # The location can change at any time, so clients revalidate on every load
+        return _conditional_json(body, hashlib.blake2s(body, digest_size=8).hexdigest())
 
 
 # Create route handler instance
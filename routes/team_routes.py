@@ -4,7 +4,7 @@ Team Management Routes Module
 """
 from flask import render_template, session, request, jsonify, redirect, url_for
 from typing import Tuple, Dict, Any
-from database import DatabaseManager
+from database import db_manager
 from utils.logger import app_logger
 from services import response_service
 from utils.error_handler import ErrorHandler, ErrorCategories
@@ -14,7 +14,7 @@ class TeamRoutes:
     """Team management route handlers"""
 
     def __init__(self):
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager
 
     def register_routes(self, app):
         """Register team management routes"""
@@ -1,11 +1,19 @@
 """
 The code changes focus on saving and loading structure placement data within the terrain routes module to ensure it's persisted during cut and fill analysis.
 """
-import json
+import asyncio
+import hashlib
+import logging
 import math
-from flask import request, jsonify, render_template, session
+import numpy as np
+from flask import Response, request, jsonify, render_template, session
+from auth import get_session_id
+from services.project_service import project_service
+from services.site_data_store_service import site_data_store_service
 from utils.logger import app_logger
-from typing import Dict, Any
+from utils.json_utils import dumps_bytes, loads_bytes
+from database import db_manager
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # Try to import terrain service with graceful fallback
@@ -18,6 +26,114 @@ except ImportError as e:
     terrain_service = None
     TERRAIN_AVAILABLE = False
 
+# Assembled site data is cached in project_service.site_data_cache with the snapshot version it was
+# built from. Snapshots are only ever written with INSERT OR REPLACE, which assigns a new row id, so
+# (MAX(id), COUNT(*)) changes whenever a snapshot is saved or deleted.
+_SITE_SNAPSHOT_TYPES = frozenset(('site_boundary', 'buildable_area', 'structure_placement'))
+
+# 50m buffer around the site boundary for terrain bounds, as degrees of latitude (~0.00045)
+METERS_PER_DEGREE_LAT = 111320.0
+TERRAIN_BUFFER_DEG_LAT = 50.0 / METERS_PER_DEGREE_LAT
+
+# Terrain data only covers New Zealand
+NZ_LAT_MIN, NZ_LAT_MAX = -47.0, -34.0
+NZ_LNG_MIN, NZ_LNG_MAX = 166.0, 179.0
+
+
+def _coordinate_array(coordinates) -> Optional[np.ndarray]:
+    """(N, 2) float array of [lng, lat] rows, or None when the points are ragged or non-numeric"""
+    try:
+        coords_arr = np.asarray(coordinates, dtype=np.float64)
+    except (ValueError, TypeError):
+        return None
+    if coords_arr.ndim != 2 or coords_arr.shape[1] < 2:
+        return None
+    return coords_arr[:, :2]
+
+
+def _lnglat_array_from_dicts(coordinates) -> Optional[np.ndarray]:
+    """[lng, lat] rows from {lat, lng} or {latitude, longitude} dicts, or None when keys are mixed"""
+    first_coord = coordinates[0]
+    if 'lat' in first_coord and 'lng' in first_coord:
+        lat_key, lng_key = 'lat', 'lng'
+    elif 'latitude' in first_coord and 'longitude' in first_coord:
+        lat_key, lng_key = 'latitude', 'longitude'
+    else:
+        return None
+
+    # Key pair picked once from the first point, then one column pass each
+    count = len(coordinates)
+    try:
+        lngs = np.fromiter((coord[lng_key] for coord in coordinates), dtype=np.float64, count=count)
+        lats = np.fromiter((coord[lat_key] for coord in coordinates), dtype=np.float64, count=count)
+    except (KeyError, TypeError, ValueError):
+        return None
+    return np.column_stack((lngs, lats))
+
+
+def _snapshot_version(cursor, project_id: int, user_id: int) -> tuple:
+    """Cheap (MAX(id), COUNT(id)) probe that changes whenever a project snapshot is saved or deleted"""
+    cursor.execute("""
+        SELECT MAX(id), COUNT(id)
+        FROM project_snapshots
+        WHERE project_id = ? AND user_id = ?
+    """, (project_id, user_id))
+    return tuple(cursor.fetchone())
+
+
+def _site_data_etag(project_id: int, user_id: int, snapshot_version: tuple,
+                    project: Optional[Dict[str, Any]]) -> str:
+    """Validator for a project's loaded site data, built from its snapshot version and project summary"""
+    project_key = tuple(sorted(project.items())) if project else None
+    version_key = repr((project_id, user_id, snapshot_version, project_key))
+    return hashlib.blake2s(version_key.encode(), digest_size=8).hexdigest()
+
+
+def _stored_site_data() -> Dict[str, Any]:
+    """Site data for the current session, falling back to data saved in the session cookie"""
+    site_data = site_data_store_service.get(get_session_id())
+    if site_data is None:
+        site_data = session.get('site_data') or {}
+    return site_data
+
+
+def _store_site_data(site_data: Dict[str, Any]) -> None:
+    """Keep site data server-side so the coordinates are not signed into every response cookie"""
+    site_data_store_service.set(get_session_id(), site_data)
+    session.pop('site_data', None)
+
+
+def _validate_nz_location(site_data) -> Tuple[bool, Optional[str]]:
+    """Quick validation to check if a site's first coordinate is in New Zealand"""
+    coordinates = site_data.get('coordinates', [])
+    if not coordinates:
+        return False, "No coordinates found"
+
+    # Get first coordinate for location check
+    first_coord = coordinates[0]
+    try:
+        if isinstance(first_coord, dict):
+            lat = float(first_coord.get('lat', 0))
+            lng = float(first_coord.get('lng', 0))
+        elif isinstance(first_coord, (list, tuple)) and len(first_coord) >= 2:
+            if isinstance(first_coord[0], (int, float)):
+                lng, lat = float(first_coord[0]), float(first_coord[1])
+            elif isinstance(first_coord[0], (list, tuple)):
+                lng, lat = float(first_coord[0][0]), float(first_coord[0][1])
+            else:
+                return False, "Invalid coordinate format"
+        else:
+            return False, "Unsupported coordinate format"
+
+        # Check if coordinates are in New Zealand bounds
+        if not (NZ_LAT_MIN <= lat <= NZ_LAT_MAX and NZ_LNG_MIN <= lng <= NZ_LNG_MAX):
+            return False, f"Location ({lat:.4f}, {lng:.4f}) is outside New Zealand"
+
+        return True, None
+
+    except (ValueError, TypeError, IndexError) as e:
+        return False, f"Error parsing coordinates: {str(e)}"
+
 
 class TerrainRoutes:
     """Terrain route handlers"""
@@ -27,7 +143,6 @@ class TerrainRoutes:
     def handle_terrain_viewer(self):
         """Handle terrain viewer page"""
         try:
-            from flask import request
             app_logger.info("Terrain viewer page requested")
 
             # Get project ID from query parameters with multiple parameter names
@@ -38,6 +153,10 @@ class TerrainRoutes:
                 project_id = session.get('current_project_id')
                 app_logger.info(f"No project ID in URL, trying session: {project_id}")
 
+            # Session values may already be ints
+            if project_id:
+                project_id = str(project_id)
+
             # Clean up malformed project IDs (remove any extra parameters)
             if project_id and ('?' in project_id or '&' in project_id):
                 project_id = project_id.split('?')[0].split('&')[0]
@@ -45,49 +164,42 @@ class TerrainRoutes:
 
             # Validate project ID format
             if project_id:
-                project_id = str(project_id).strip()
+                project_id = project_id.strip()
                 if not project_id.isdigit():
                     app_logger.warning(f"Invalid project ID format: {project_id}")
                     project_id = None
                 else:
+                    # Bound as an int from here on, matching the INTEGER id columns
+                    project_id = int(project_id)
                     app_logger.info(f"Using project ID: {project_id}")
                     # Store in session for future use
                     session['current_project_id'] = project_id
             else:
                 app_logger.info("No project ID provided to terrain viewer")
 
-            # Get site data from session
-            site_data = session.get('site_data', {})
+            # Get site data stored for this session
+            site_data = _stored_site_data()
 
             # Get project data if project_id is provided
             project_data = {}
             if project_id:
                 try:
-                    from database import DatabaseManager
-                    db_manager = DatabaseManager()
                     user_id = session.get('user', {}).get('id')
 
                     if user_id:
-                        with db_manager.db.get_cursor() as cursor:
-                            cursor.execute("""
-                                SELECT name, address, location_lat, location_lng, created_at 
-                                FROM projects 
-                                WHERE id = ? AND user_id = ?
-                            """, (project_id, user_id))
-
-                            project_row = cursor.fetchone()
-                            if project_row:
-                                project_data = {
-                                    'id': project_id,
-                                    'name': project_row[0],
-                                    'address': project_row[1],
-                                    'lat': project_row[2],
-                                    'lng': project_row[3],
-                                    'created_at': project_row[4]
-                                }
-                                app_logger.info(f"Project data loaded for terrain viewer: {project_data['name']} at {project_data['address']}")
-                            else:
-                                app_logger.warning(f"No project found with ID {project_id} for user {user_id}")
+                        project = project_service.get_project_summary(project_id, user_id)
+                        if project:
+                            project_data = {
+                                'id': project_id,
+                                'name': project['name'],
+                                'address': project['address'],
+                                'lat': project['location_lat'],
+                                'lng': project['location_lng'],
+                                'created_at': project['created_at']
+                            }
+                            app_logger.info(f"Project data loaded for terrain viewer: {project_data['name']} at {project_data['address']}")
+                        else:
+                            app_logger.warning(f"No project found with ID {project_id} for user {user_id}")
                     else:
                         app_logger.warning("No user ID found in session for terrain viewer")
                 except Exception as e:
@@ -99,18 +211,19 @@ class TerrainRoutes:
             if project_id:
                 project_site_data = self._load_site_data_from_project(project_id)
                 if project_site_data:
-                    app_logger.info(f"Loaded site data from project snapshots: {list(project_site_data.keys())}")
-                    # Merge with existing site data, prioritizing project data
-                    if site_data:
-                        site_data.update(project_site_data)
-                    else:
-                        site_data = project_site_data
-                    # Store in session for future use
-                    session['site_data'] = site_data
+                    if app_logger.isEnabledFor(logging.INFO):
+                        app_logger.info(f"Loaded site data from project snapshots: {list(project_site_data.keys())}")
+                    # Merge with existing site data, prioritizing project data. The loader hands back
+                    # a fresh top-level dict, so it takes the few stored keys instead of being copied
+                    for key, value in site_data.items():
+                        project_site_data.setdefault(key, value)
+                    site_data = project_site_data
+                    # Store server-side for future use
+                    _store_site_data(site_data)
 
             return render_template('terrain_viewer.html', 
                                  site_data=site_data,
-                                 site_data_json=json.dumps(site_data) if site_data else '{}',
+                                 site_data_json=dumps_bytes(site_data).decode() if site_data else '{}',
                                  project_data=project_data)
 
         except Exception as e:
@@ -118,16 +231,15 @@ class TerrainRoutes:
             error_data = {'error': str(e)}
             return render_template('terrain_viewer.html', 
                                  site_data=error_data,
-                                 site_data_json=json.dumps(error_data),
+                                 site_data_json=dumps_bytes(error_data).decode(),
                                  project_data={})
 
-    def _load_site_data_from_project(self, project_id):
-        """Load site boundary, setbacks, and structure data from project snapshots"""
-        try:
-            from database import DatabaseManager
-            import json
+    def _load_site_data_from_project(self, project_id: int, snapshot_version: Optional[tuple] = None):
+        """Load site boundary, setbacks, and structure data from project snapshots
 
-            db_manager = DatabaseManager()
+        snapshot_version may be passed in when the caller has already probed it.
+        """
+        try:
             user_id = session.get('user', {}).get('id')
 
             if not user_id:
@@ -135,8 +247,27 @@ class TerrainRoutes:
                 return None
 
             site_data = {}
+            cache_key = (project_id, user_id)
+            boundary_arr = None
+            structure_data = None
+
+            # Usually already cached by the viewer page that called us
+            project = project_service.get_project_summary(project_id, user_id)
+
+            with db_manager.db.get_read_cursor() as cursor:
+                # Cheap version probe, so unchanged projects skip the snapshot load and JSON parsing
+                if snapshot_version is None:
+                    snapshot_version = _snapshot_version(cursor, project_id, user_id)
+
+                cached = project_service.site_data_cache.get(cache_key)
+                if cached and cached[0] == snapshot_version:
+                    # Top-level copy so callers can add keys; nested values are shared and not mutated
+                    site_data = dict(cached[1])
+                    if cached[2] is not None:
+                        session['floorplan_data'] = cached[2]
+                    app_logger.info(f"Using cached site data for project {project_id}")
+                    return site_data
 
-            with db_manager.db.get_cursor() as cursor:
                 # Load all snapshots for this project
                 cursor.execute("""
                     SELECT snapshot_type, snapshot_data, updated_at
@@ -146,51 +277,52 @@ class TerrainRoutes:
                 """, (project_id, user_id))
 
                 snapshots = cursor.fetchall()
-                app_logger.info(f"Found {len(snapshots)} snapshots for project {project_id}")
-
-                # Debug: Log all available snapshot types
-                snapshot_types = [snapshot[0] for snapshot in snapshots]
-                app_logger.info(f"Available snapshot types: {snapshot_types}")
+                if app_logger.isEnabledFor(logging.DEBUG):
+                    app_logger.debug(f"Found {len(snapshots)} snapshots for project {project_id}: {[snapshot[0] for snapshot in snapshots]}")
 
+                # Rows are newest first, so only the first row of each handled type is parsed
+                seen_types = set()
                 for snapshot_type, snapshot_data, updated_at in snapshots:
+                    if snapshot_type in seen_types or snapshot_type not in _SITE_SNAPSHOT_TYPES:
+                        continue
+                    seen_types.add(snapshot_type)
                     try:
-                        # Parse snapshot data
-                        if isinstance(snapshot_data, str):
-                            data = json.loads(snapshot_data)
+                        # Parse snapshot data (orjson takes str or bytes directly)
+                        if isinstance(snapshot_data, (str, bytes)):
+                            data = loads_bytes(snapshot_data)
                         else:
                             data = snapshot_data
 
-                        app_logger.info(f"Processing snapshot type: {snapshot_type}")
-                        app_logger.info(f"Snapshot data keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
+                        if app_logger.isEnabledFor(logging.DEBUG):
+                            app_logger.debug(f"Processing snapshot type: {snapshot_type}, keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
 
                         if snapshot_type == 'site_boundary':
                             # Load site boundary coordinates
                             coordinates = data.get('coordinates', [])
+                            boundary_arr = None
 
                             # Normalize coordinate format for terrain service
                             if coordinates and isinstance(coordinates[0], dict):
                                 # Convert from {lat: x, lng: y} format to [lng, lat] format
-                                normalized_coords = []
-                                for coord in coordinates:
-                                    if 'lat' in coord and 'lng' in coord:
-                                        normalized_coords.append([coord['lng'], coord['lat']])
-                                    elif 'latitude' in coord and 'longitude' in coord:
-                                        normalized_coords.append([coord['longitude'], coord['latitude']])
+                                boundary_arr = _lnglat_array_from_dicts(coordinates)
+                                if boundary_arr is not None:
+                                    normalized_coords = boundary_arr.tolist()
+                                else:
+                                    # Mixed key styles, convert point by point
+                                    normalized_coords = []
+                                    for coord in coordinates:
+                                        if 'lat' in coord and 'lng' in coord:
+                                            normalized_coords.append([coord['lng'], coord['lat']])
+                                        elif 'latitude' in coord and 'longitude' in coord:
+                                            normalized_coords.append([coord['longitude'], coord['latitude']])
                                 coordinates = normalized_coords
-                                app_logger.info(f"Converted {len(coordinates)} coordinates from dict to [lng,lat] format")
 
                             site_data['coordinates'] = coordinates
                             site_data['area_m2'] = data.get('area_m2', 0)
                             site_data['boundary_type'] = 'site_boundary'
 
-                            # Debug coordinate structure
-                            if coordinates:
-                                first_coord = coordinates[0]
-                                app_logger.info(f"First coordinate type: {type(first_coord)}, value: {first_coord}")
-                                if isinstance(first_coord, (list, tuple)) and len(first_coord) >= 2:
-                                    app_logger.info(f"First coord elements: [{type(first_coord[0])}: {first_coord[0]}, {type(first_coord[1])}: {first_coord[1]}]")
-
-                            app_logger.info(f"Loaded site boundary with {len(coordinates)} coordinates")
+                            if app_logger.isEnabledFor(logging.DEBUG):
+                                app_logger.debug(f"Loaded site boundary with {len(coordinates)} coordinates, first: {coordinates[0] if coordinates else None}")
 
                         elif snapshot_type == 'buildable_area':
                             # Load setback polygon data
@@ -209,9 +341,9 @@ class TerrainRoutes:
                             terrain_bounds = data.get('terrain_bounds')
                             if terrain_bounds:
                                 site_data['terrainBounds'] = terrain_bounds
-                                app_logger.info(f"Loaded terrain bounds from buildable area snapshot")
 
-                            app_logger.info(f"Loaded buildable area with {len(buildable_coords)} coordinates")
+                            if app_logger.isEnabledFor(logging.DEBUG):
+                                app_logger.debug(f"Loaded buildable area with {len(buildable_coords)} coordinates, terrain bounds: {bool(terrain_bounds)}")
 
                         elif snapshot_type == 'structure_placement':
                             # Load structure/floorplan data
@@ -235,34 +367,28 @@ class TerrainRoutes:
                                 'structure_type': data.get('structure_type', 'floorplan')
                             }
 
-                            # Store in session for current use
+                            # The full floorplan record only goes to the session; site_data keeps the
+                            # lighter structure_placement so the coordinates are not sent twice
                             session['floorplan_data'] = structure_data
-                            site_data['floorplan_data'] = structure_data
 
-                            app_logger.info(f"Loaded structure placement with {len(structure_coords)} boundary points")
+                            if app_logger.isEnabledFor(logging.DEBUG):
+                                app_logger.debug(f"Loaded structure placement with {len(structure_coords)} boundary points")
 
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         app_logger.error(f"Failed to parse snapshot data for type {snapshot_type}: {e}")
                         continue
 
                 # Add project address and metadata for terrain service
                 if site_data:
-                    cursor.execute("""
-                        SELECT address, location_lat, location_lng, name 
-                        FROM projects 
-                        WHERE id = ? AND user_id = ?
-                    """, (project_id, user_id))
-
-                    project_row = cursor.fetchone()
-                    if project_row:
-                        site_data['address'] = project_row[0]
-                        site_data['project_name'] = project_row[3]
+                    if project:
+                        site_data['address'] = project['address']
+                        site_data['project_name'] = project['name']
                         site_data['project_id'] = project_id
 
-                        if project_row[1] and project_row[2]:
-                            site_data['center_lat'] = project_row[1]
-                            site_data['center_lng'] = project_row[2]
-                            app_logger.info(f"Added project metadata: {project_row[3]} at {project_row[0]}")
+                        if project['location_lat'] and project['location_lng']:
+                            site_data['center_lat'] = project['location_lat']
+                            site_data['center_lng'] = project['location_lng']
+                            app_logger.info(f"Added project metadata: {project['name']} at {project['address']}")
                         else:
                             app_logger.warning(f"Project {project_id} missing lat/lng coordinates")
 
@@ -270,13 +396,26 @@ class TerrainRoutes:
                             if site_data.get('coordinates'):
                                 try:
                                     coords = site_data['coordinates']
-                                    total_lng = sum(coord[0] for coord in coords if len(coord) >= 2)
-                                    total_lat = sum(coord[1] for coord in coords if len(coord) >= 2)
-                                    valid_coords = len([coord for coord in coords if len(coord) >= 2])
+                                    coords_arr = boundary_arr if boundary_arr is not None else _coordinate_array(coords)
+                                    if coords_arr is not None:
+                                        # Uniform points: one vectorized mean over the whole ring
+                                        site_data['center_lng'], site_data['center_lat'] = coords_arr.mean(axis=0).tolist()
+                                        valid_coords = len(coords_arr)
+                                    else:
+                                        # Single pass over the points, summing and counting together
+                                        total_lng = total_lat = 0.0
+                                        valid_coords = 0
+                                        for coord in coords:
+                                            if len(coord) >= 2:
+                                                total_lng += coord[0]
+                                                total_lat += coord[1]
+                                                valid_coords += 1
+
+                                        if valid_coords > 0:
+                                            site_data['center_lat'] = total_lat / valid_coords
+                                            site_data['center_lng'] = total_lng / valid_coords
 
                                     if valid_coords > 0:
-                                        site_data['center_lat'] = total_lat / valid_coords
-                                        site_data['center_lng'] = total_lng / valid_coords
                                         app_logger.info(f"Calculated center from site boundary: lat={site_data['center_lat']}, lng={site_data['center_lng']}")
                                 except Exception as e:
                                     app_logger.error(f"Error calculating center from site boundary: {e}")
@@ -286,15 +425,20 @@ class TerrainRoutes:
                     app_logger.info("Generating terrain bounds from site boundary")
                     coordinates = site_data['coordinates']
 
-                    # Calculate bounding box with 50m buffer
-                    min_lng = min(coord[0] for coord in coordinates)
-                    max_lng = max(coord[0] for coord in coordinates)
-                    min_lat = min(coord[1] for coord in coordinates)
-                    max_lat = max(coord[1] for coord in coordinates)
+                    # Calculate bounding box with 50m buffer, in one vectorized pass when the points are uniform
+                    coords_arr = boundary_arr if boundary_arr is not None else _coordinate_array(coordinates)
+                    if coords_arr is not None and len(coords_arr):
+                        min_lng, min_lat = coords_arr.min(axis=0).tolist()
+                        max_lng, max_lat = coords_arr.max(axis=0).tolist()
+                    else:
+                        min_lng = min(coord[0] for coord in coordinates)
+                        max_lng = max(coord[0] for coord in coordinates)
+                        min_lat = min(coord[1] for coord in coordinates)
+                        max_lat = max(coord[1] for coord in coordinates)
 
-                    # Convert 50m buffer to degrees
-                    lat_buffer = 50 / 111320  # ~0.00045 degrees
-                    lng_buffer = 50 / (111320 * math.cos((min_lat + max_lat) / 2 * math.pi / 180))
+                    # Convert 50m buffer to degrees; longitude degrees shrink with cos(latitude)
+                    lat_buffer = TERRAIN_BUFFER_DEG_LAT
+                    lng_buffer = TERRAIN_BUFFER_DEG_LAT / math.cos(math.radians((min_lat + max_lat) * 0.5))
 
                     site_data['terrainBounds'] = {
                         'southwest': [min_lng - lng_buffer, min_lat - lat_buffer],
@@ -312,13 +456,18 @@ class TerrainRoutes:
 
                     # Create a simple inset polygon (this is a simplified approach)
                     # In a real scenario, you'd use proper polygon offset algorithms
-                    buildable_coords = []
-                    for coord in site_coords[:-1]:  # Exclude last coordinate if it duplicates first
-                        if isinstance(coord, (list, tuple)):
-                            # Offset each point slightly inward (simplified approach)
-                            lng, lat = coord[0], coord[1]
-                            offset = 0.00003  # Approximate 3m offset in degrees
-                            buildable_coords.append([lng + offset, lat + offset])
+                    offset = 0.00003  # Approximate 3m offset in degrees
+                    coords_arr = boundary_arr if boundary_arr is not None else _coordinate_array(site_coords)
+                    if coords_arr is not None:
+                        # Exclude last coordinate if it duplicates first, shift every point in one operation
+                        buildable_coords = (coords_arr[:-1] + offset).tolist()
+                    else:
+                        buildable_coords = []
+                        for coord in site_coords[:-1]:  # Exclude last coordinate if it duplicates first
+                            if isinstance(coord, (list, tuple)):
+                                # Offset each point slightly inward (simplified approach)
+                                lng, lat = coord[0], coord[1]
+                                buildable_coords.append([lng + offset, lat + offset])
 
                     if buildable_coords:
                         site_data['buildable_area'] = {
@@ -332,7 +481,14 @@ class TerrainRoutes:
                         }
                         app_logger.info(f"Created default buildable area with {len(buildable_coords)} coordinates")
 
-                return site_data if site_data else None
+                if not site_data:
+                    return None
+                if project is None:
+                    # Not the user's project, so there is nothing to key a cached copy on
+                    return site_data
+
+                project_service.site_data_cache.set(cache_key, (snapshot_version, site_data, structure_data))
+                return dict(site_data)
 
         except Exception as e:
             app_logger.error(f"Error loading site data from project {project_id}: {e}")
@@ -341,7 +497,7 @@ class TerrainRoutes:
 
             return render_template('terrain_viewer.html', 
                                  site_data=site_data,
-                                 site_data_json=json.dumps(site_data) if site_data else '{}',
+                                 site_data_json=dumps_bytes(site_data).decode() if site_data else '{}',
                                  project_data=project_data)
 
         except Exception as e:
@@ -349,12 +505,25 @@ class TerrainRoutes:
             error_data = {'error': str(e)}
             return render_template('terrain_viewer.html', 
                                  site_data=error_data,
-                                 site_data_json=json.dumps(error_data),
+                                 site_data_json=dumps_bytes(error_data).decode(),
                                  project_data={})
 
     def handle_terrain_cache_stats(self):
         """Get terrain service cache statistics"""
-
+        try:
+            cache_stats = terrain_service.get_cache_stats()
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Terrain cache stats requested: {cache_stats}")
+            return jsonify({
+                'success': True,
+                'cache_stats': cache_stats
+            })
+        except Exception as e:
+            app_logger.error(f"Error getting terrain cache stats: {e}")
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
 
     def handle_load_site_data(self):
         """Load site data from project snapshots for terrain analysis"""
@@ -374,36 +543,65 @@ class TerrainRoutes:
                     'error': 'Project ID is required'
                 }), 400
 
+            try:
+                project_id = int(project_id)
+            except (TypeError, ValueError):
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid project ID'
+                }), 400
+
             app_logger.info(f"Loading site data for project ID: {project_id}")
 
-            site_data = self._load_site_data_from_project(project_id)
+            # One version probe serves both the ETag and the loader's cache check
+            etag = None
+            snapshot_version = None
+            user_id = session.get('user', {}).get('id')
+            if user_id:
+                with db_manager.db.get_read_cursor() as cursor:
+                    snapshot_version = _snapshot_version(cursor, project_id, user_id)
+                project = project_service.get_project_summary(project_id, user_id)
+                etag = _site_data_etag(project_id, user_id, snapshot_version, project)
+
+            site_data = self._load_site_data_from_project(project_id, snapshot_version)
 
             if site_data:
-                # Store in session for terrain generation
-                session['site_data'] = site_data
+                # Store server-side for terrain generation
+                _store_site_data(site_data)
+                session['current_project_id'] = project_id
 
-                polygon_count = 0
-                polygon_types = []
+                # The session store and floorplan are restored above, so a client holding this
+                # exact payload only needs the 304. make_conditional only handles GET/HEAD.
+                if etag and request.if_none_match.contains_weak(etag):
+                    not_modified = Response(status=304)
+                    not_modified.set_etag(etag, weak=True)
+                    return not_modified
 
+                polygon_types = []
                 if site_data.get('coordinates'):
-                    polygon_count += 1
                     polygon_types.append('site boundary')
-                if site_data.get('buildable_area', {}).get('coordinates'):
-                    polygon_count += 1
+                if (site_data.get('buildable_area') or {}).get('coordinates'):
                     polygon_types.append('buildable area')
-                if site_data.get('structure_placement', {}).get('coordinates'):
-                    polygon_count += 1
+                if (site_data.get('structure_placement') or {}).get('coordinates'):
                     polygon_types.append('structure placement')
+                polygon_count = len(polygon_types)
 
-                app_logger.info(f"Successfully loaded site data with {polygon_count} polygons: {', '.join(polygon_types)}")
+                if app_logger.isEnabledFor(logging.INFO):
+                    app_logger.info(f"Successfully loaded site data with {polygon_count} polygons: {', '.join(polygon_types)}")
 
-                return jsonify({
+                response = jsonify({
                     'success': True,
                     'message': f'Site data loaded successfully with {polygon_count} polygon(s): {", ".join(polygon_types)}',
                     'site_data': site_data,
                     'polygon_count': polygon_count,
                     'polygon_types': polygon_types
                 })
+                if etag:
+                    response.set_etag(etag, weak=True)
+                    response.cache_control.private = True
+                    response.cache_control.max_age = 0
+                    response.cache_control.must_revalidate = True
+                return response
             else:
                 app_logger.warning(f"No site data found for project {project_id}")
                 return jsonify({
@@ -418,26 +616,9 @@ class TerrainRoutes:
                 'error': f'Failed to load site data: {str(e)}'
             }), 500
 
-
-        try:
-            from services.terrain_service import terrain_service
-            cache_stats = terrain_service.get_cache_stats()
-            app_logger.info(f"Terrain cache stats requested: {cache_stats}")
-            return jsonify({
-                'success': True,
-                'cache_stats': cache_stats
-            })
-        except Exception as e:
-            app_logger.error(f"Error getting terrain cache stats: {e}")
-            return jsonify({
-                'success': False,
-                'error': str(e)
-            }), 500
-
     def handle_clear_terrain_cache(self):
         """Clear terrain service coordinate cache"""
         try:
-            from services.terrain_service import terrain_service
             terrain_service.clear_coordinate_cache()
             app_logger.info("Terrain coordinate cache cleared")
             return jsonify({
@@ -463,41 +644,10 @@ class TerrainRoutes:
 
             app_logger.info("Terrain generation request - Service available: True")
 
-            # Early validation for New Zealand coordinates
-            def validate_nz_location(site_data):
-                """Quick validation to check if location is in New Zealand"""
-                coordinates = site_data.get('coordinates', [])
-                if not coordinates:
-                    return False, "No coordinates found"
-
-                # Get first coordinate for location check
-                first_coord = coordinates[0]
-                try:
-                    if isinstance(first_coord, dict):
-                        lat = float(first_coord.get('lat', 0))
-                        lng = float(first_coord.get('lng', 0))
-                    elif isinstance(first_coord, (list, tuple)) and len(first_coord) >= 2:
-                        if isinstance(first_coord[0], (int, float)):
-                            lng, lat = float(first_coord[0]), float(first_coord[1])
-                        elif isinstance(first_coord[0], (list, tuple)):
-                            lng, lat = float(first_coord[0][0]), float(first_coord[0][1])
-                        else:
-                            return False, "Invalid coordinate format"
-                    else:
-                        return False, "Unsupported coordinate format"
-
-                    # Check if coordinates are in New Zealand bounds
-                    if not (-47.0 <= lat <= -34.0) or not (166.0 <= lng <= 179.0):
-                        return False, f"Location ({lat:.4f}, {lng:.4f}) is outside New Zealand"
-
-                    return True, None
-
-                except (ValueError, TypeError, IndexError) as e:
-                    return False, f"Error parsing coordinates: {str(e)}"
-
             # Get request data
             data = request.get_json()
-            app_logger.info(f"Terrain generation request: {list(data.keys()) if data else 'No data'}")
+            if app_logger.isEnabledFor(logging.INFO):
+                app_logger.info(f"Terrain generation request: {list(data.keys()) if data else 'No data'}")
 
             if not data or 'site_data' not in data:
                 return jsonify({'success': False, 'error': 'No site data provided'}), 400
@@ -505,7 +655,7 @@ class TerrainRoutes:
             site_data = data['site_data']
 
             # Early validation for New Zealand location
-            is_valid_location, location_error = validate_nz_location(site_data)
+            is_valid_location, location_error = _validate_nz_location(site_data)
             if not is_valid_location:
                 app_logger.warning(f"Terrain generation attempted for non-NZ location: {location_error}")
                 return jsonify({
@@ -517,7 +667,6 @@ class TerrainRoutes:
                 })
 
             # Enhance site data with location information from session if available
-            from flask import session
             if 'location_data' in session:
                 location_data = session['location_data']
                 if not site_data.get('address'):
@@ -534,18 +683,22 @@ class TerrainRoutes:
             address = site_data.get('address', 'Unknown location')
 
             # Log available polygon data for terrain visualization
-            polygon_info = []
-            if site_data.get('coordinates'):
-                polygon_info.append(f"Site boundary ({len(site_data['coordinates'])} points)")
-            if site_data.get('buildable_area', {}).get('coordinates'):
-                polygon_info.append(f"Buildable area ({len(site_data['buildable_area']['coordinates'])} points)")
-            if site_data.get('structure_placement', {}).get('coordinates'):
-                polygon_info.append(f"Structure placement ({len(site_data['structure_placement']['coordinates'])} points)")
-
-            if polygon_info:
-                app_logger.info(f"Starting terrain generation for site: {address} with polygons: {', '.join(polygon_info)}")
-            else:
-                app_logger.info(f"Starting terrain generation for site: {address}")
+            if app_logger.isEnabledFor(logging.INFO):
+                boundary_coords = site_data.get('coordinates')
+                buildable_coords = (site_data.get('buildable_area') or {}).get('coordinates')
+                structure_coords = (site_data.get('structure_placement') or {}).get('coordinates')
+                polygon_info = []
+                if boundary_coords:
+                    polygon_info.append(f"Site boundary ({len(boundary_coords)} points)")
+                if buildable_coords:
+                    polygon_info.append(f"Buildable area ({len(buildable_coords)} points)")
+                if structure_coords:
+                    polygon_info.append(f"Structure placement ({len(structure_coords)} points)")
+
+                if polygon_info:
+                    app_logger.info(f"Starting terrain generation for site: {address} with polygons: {', '.join(polygon_info)}")
+                else:
+                    app_logger.info(f"Starting terrain generation for site: {address}")
 
             # Progress tracking storage
             progress_data = {
@@ -563,7 +716,8 @@ class TerrainRoutes:
                     progress_data['percentage'] = min(100, max(0, percentage))
                 if step not in progress_data['steps_completed']:
                     progress_data['steps_completed'].append(step)
-                app_logger.info(f"Progress Step {step}: {message} ({progress_data['percentage']}%)")
+                if app_logger.isEnabledFor(logging.INFO):
+                    app_logger.info(f"Progress Step {step}: {message} ({progress_data['percentage']}%)")
 
             # Generate terrain data with progress tracking
             result = terrain_service.generate_terrain_data(site_data, progress_callback)
@@ -601,66 +755,31 @@ class TerrainRoutes:
                 }
             }), 500
 
+    # (path, endpoint, handler name, methods)
+    _ROUTES = (
+        ('/terrain-viewer', 'terrain_viewer', 'handle_terrain_viewer', ['GET']),
+        # Main terrain generation API
+        ('/api/generate-terrain', 'generate_terrain', 'handle_generate_terrain', ['POST']),
+        # Terrain cache management routes
+        ('/api/terrain-cache-stats', 'terrain_cache_stats', 'handle_terrain_cache_stats', ['GET']),
+        ('/api/clear-terrain-cache', 'clear_terrain_cache', 'handle_clear_terrain_cache', ['POST']),
+        # Site data loading for terrain analysis
+        ('/api/load-site-data', 'load_site_data', 'handle_load_site_data', ['POST']),
+        # Session data storage for terrain analysis
+        ('/api/store-session-data', 'store_session_data', 'handle_store_session_data', ['POST']),
+    )
+
     def register_routes(self, app):
         """Register routes with Flask app"""
         self.app = app
         self.total_routes = 0
 
-        with app.app_context():
-            self.app.add_url_rule('/terrain-viewer', 'terrain_viewer', 
-                                 self.handle_terrain_viewer, methods=['GET'])
-
-            app_logger.info(f"✅ Successfully registered: /terrain-viewer")
-
-            # Main terrain generation API
-            self.app.add_url_rule('/api/generate-terrain', 'generate_terrain',
-                                 self.handle_generate_terrain, methods=['POST'])
-
-            app_logger.info(f"✅ Successfully registered: /api/generate-terrain")
-
-            # Terrain cache management routes
-            self.app.add_url_rule('/api/terrain-cache-stats', 'terrain_cache_stats',
-                                 self.handle_terrain_cache_stats, methods=['GET'])
-
-            app_logger.info(f"✅ Successfully registered: /api/terrain-cache-stats")
-
-            self.app.add_url_rule('/api/clear-terrain-cache', 'clear_terrain_cache',
-                                 self.handle_clear_terrain_cache, methods=['POST'])
-
-            app_logger.info(f"✅ Successfully registered: /api/clear-terrain-cache")
+        for path, endpoint, handler_name, methods in self._ROUTES:
+            app.add_url_rule(path, endpoint, getattr(self, handler_name), methods=methods)
+            self.total_routes += 1
 
-            # Site data loading for terrain analysis
-            self.app.add_url_rule('/api/load-site-data', 'load_site_data',
-                                 self.handle_load_site_data, methods=['POST'])
-
-            app_logger.info(f"✅ Successfully registered: /api/load-site-data")
-
-            # Add route to provide mapbox token
-            self.app.add_url_rule('/api/mapbox-token', 'mapbox_token',
-                                 self.handle_mapbox_token, methods=['GET'])
-
-            app_logger.info(f"✅ Successfully registered: /api/mapbox-token")
-
-            # Session data storage for terrain analysis
-            self.app.add_url_rule('/api/store-session-data', 'store_session_data',
-                                 self.handle_store_session_data, methods=['POST'])
-
-            app_logger.info(f"✅ Successfully registered: /api/store-session-data")
-
-            self.total_routes += 7
-
-    def handle_mapbox_token(self):
-        """Provide Mapbox token to the client"""
-        try:
-            from services.terrain_service import terrain_service
-        except ImportError:
-            return jsonify({'success': False, 'error': 'Terrain service unavailable'}), 500
-
-        if not terrain_service.mapbox_token:
-            app_logger.warning("Mapbox token is not configured")
-            return jsonify({'success': False, 'error': 'Mapbox token is not configured'}), 500
-
-        return jsonify({'success': True, 'token': terrain_service.mapbox_token})
+        if app_logger.isEnabledFor(logging.INFO):
+            app_logger.info(f"✅ Successfully registered {self.total_routes} terrain routes: {', '.join(route[0] for route in self._ROUTES)}")
 
     def handle_store_session_data(self):
         """Store site data and terrain bounds in session for terrain analysis"""
@@ -672,12 +791,12 @@ class TerrainRoutes:
             site_data = data.get('site_data', {})
             terrain_bounds = data.get('terrain_bounds')
 
-            # Store in session
-            session['site_data'] = site_data
+            # Site data is stored server-side; the small bounds dict stays in the session
+            _store_site_data(site_data)
             if terrain_bounds:
                 session['terrain_bounds'] = terrain_bounds
 
-            app_logger.info(f"Stored site data in session with terrain bounds: {terrain_bounds is not None}")
+            app_logger.info(f"Stored site data with terrain bounds: {terrain_bounds is not None}")
 
             return jsonify({
                 'success': True,
@@ -694,92 +813,88 @@ class TerrainRoutes:
     async def _save_current_project_data(self, project_id):
         """Save current site boundary, setbacks, and structure data before terrain analysis"""
         try:
-            from database import DatabaseManager
-            import json
-
-            db_manager = DatabaseManager()
             user_id = session.get('user', {}).get('id')
 
             if not user_id:
                 app_logger.warning(f"No user ID in session for project {project_id}")
                 return
 
-            # Save site boundary if available
-            site_data = session.get('site_data', {})
-            if site_data.get('coordinates'):
-                boundary_snapshot = {
-                    'coordinates': site_data['coordinates'],
-                    'area_m2': site_data.get('area_m2', 0),
-                    'center': site_data.get('center', []),
-                    'timestamp': datetime.now().isoformat()
-                }
-
-                with db_manager.db.get_cursor() as cursor:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO project_snapshots 
-                        (project_id, user_id, snapshot_type, snapshot_data, description)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        project_id, user_id, 'site_boundary',
-                        json.dumps(boundary_snapshot),
-                        'Saved before terrain analysis'
-                    ))
-
-                app_logger.info(f"Site boundary saved for project {project_id}")
-
-            # Save buildable area if available
-            buildable_area = site_data.get('buildable_area', {})
-            if buildable_area.get('buildable_coords'):
-                setbacks_snapshot = {
-                    'buildable_coords': buildable_area['buildable_coords'],
-                    'buildable_area_m2': buildable_area.get('buildable_area_m2', 0),
-                    'site_area_m2': buildable_area.get('site_area_m2', 0),
-                    'coverage_ratio': buildable_area.get('coverage_ratio', 0),
-                    'setback_details': buildable_area.get('setback_details', {}),
-                    'selected_edges': buildable_area.get('selected_edges', {}),
-                    'calculation_method': buildable_area.get('calculation_method', 'unknown'),
-                    'timestamp': datetime.now().isoformat()
-                }
-
-                with db_manager.db.get_cursor() as cursor:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO project_snapshots 
-                        (project_id, user_id, snapshot_type, snapshot_data, description)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        project_id, user_id, 'buildable_area',
-                        json.dumps(setbacks_snapshot),
-                        'Saved before terrain analysis'
-                    ))
-
-                app_logger.info(f"Buildable area saved for project {project_id}")
-
-            # Save structure/floorplan data if available
+            # Session state is read here, in the request context; serialization and the write run off the loop
+            site_data = _stored_site_data()
             floorplan_data = session.get('floorplan_data', {})
-            if floorplan_data.get('success') and floorplan_data.get('boundaries'):
-                structure_snapshot = {
-                    'boundaries': floorplan_data['boundaries'],
-                    'dimensions': floorplan_data.get('dimensions', {}),
-                    'area_m2': floorplan_data.get('area_m2', 0),
-                    'placement': floorplan_data.get('placement', {}),
-                    'structure_type': floorplan_data.get('structure_type', 'floorplan'),
-                    'rooms': floorplan_data.get('rooms', []),
-                    'walls': floorplan_data.get('walls', []),
-                    'timestamp': datetime.now().isoformat()
-                }
+            await asyncio.to_thread(self._write_snapshots_sync, project_id, user_id, site_data, floorplan_data)
 
-                with db_manager.db.get_cursor() as cursor:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO project_snapshots 
-                        (project_id, user_id, snapshot_type, snapshot_data, description)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        project_id, user_id, 'structure_placement',
-                        json.dumps(structure_snapshot),
-                        'Saved before terrain analysis'
-                    ))
+        except Exception as e:
+            app_logger.error(f"Error saving project data: {e}")
+
+    def _write_snapshots_sync(self, project_id, user_id, site_data, floorplan_data):
+        """Serialize the available snapshots and write them in one transaction (blocking)"""
+        snapshot_rows = []
+
+        # Save site boundary if available
+        if site_data.get('coordinates'):
+            boundary_snapshot = {
+                'coordinates': site_data['coordinates'],
+                'area_m2': site_data.get('area_m2', 0),
+                'center': site_data.get('center', []),
+                'timestamp': datetime.now().isoformat()
+            }
+
+            snapshot_rows.append((
+                project_id, user_id, 'site_boundary',
+                dumps_bytes(boundary_snapshot).decode(),
+                'Saved before terrain analysis'
+            ))
+
+        # Save buildable area if available
+        buildable_area = site_data.get('buildable_area', {})
+        if buildable_area.get('buildable_coords'):
+            setbacks_snapshot = {
+                'buildable_coords': buildable_area['buildable_coords'],
+                'buildable_area_m2': buildable_area.get('buildable_area_m2', 0),
+                'site_area_m2': buildable_area.get('site_area_m2', 0),
+                'coverage_ratio': buildable_area.get('coverage_ratio', 0),
+                'setback_details': buildable_area.get('setback_details', {}),
+                'selected_edges': buildable_area.get('selected_edges', {}),
+                'calculation_method': buildable_area.get('calculation_method', 'unknown'),
+                'timestamp': datetime.now().isoformat()
+            }
 
-                app_logger.info(f"Structure placement saved for project {project_id}")
+            snapshot_rows.append((
+                project_id, user_id, 'buildable_area',
+                dumps_bytes(setbacks_snapshot).decode(),
+                'Saved before terrain analysis'
+            ))
+
+        # Save structure/floorplan data if available
+        if floorplan_data.get('success') and floorplan_data.get('boundaries'):
+            structure_snapshot = {
+                'boundaries': floorplan_data['boundaries'],
+                'dimensions': floorplan_data.get('dimensions', {}),
+                'area_m2': floorplan_data.get('area_m2', 0),
+                'placement': floorplan_data.get('placement', {}),
+                'structure_type': floorplan_data.get('structure_type', 'floorplan'),
+                'rooms': floorplan_data.get('rooms', []),
+                'walls': floorplan_data.get('walls', []),
+                'timestamp': datetime.now().isoformat()
+            }
 
-        except Exception as e:
-            app_logger.error(f"Error saving project data: {e}")
\ No newline at end of file
+            snapshot_rows.append((
+                project_id, user_id, 'structure_placement',
+                dumps_bytes(structure_snapshot).decode(),
+                'Saved before terrain analysis'
+            ))
+
+        if not snapshot_rows:
+            return
+
+        # One transaction (and one commit) for all snapshot types
+        with db_manager.db.get_cursor() as cursor:
+            cursor.executemany("""
+                INSERT OR REPLACE INTO project_snapshots 
+                (project_id, user_id, snapshot_type, snapshot_data, description)
+                VALUES (?, ?, ?, ?, ?)
+            """, snapshot_rows)
+
+        if app_logger.isEnabledFor(logging.INFO):
+            app_logger.info(f"Saved {len(snapshot_rows)} snapshot(s) for project {project_id}: {[row[2] for row in snapshot_rows]}")
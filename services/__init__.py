@@ -10,6 +10,11 @@ from .api_calculation_service import ApiCalculationService, api_calculation_serv
 from .floorplan_service import floorplan_service
 from .building_service import building_service
 from .property_service import property_service
+from .user_profile_service import UserProfileService, user_profile_service
+from .project_service import ProjectService, project_service
+from .bounded_store_service import BoundedStore
+from .edge_store_service import edge_store_service
+from .site_data_store_service import site_data_store_service
 
 from .terrain_service import terrain_service
 from .earthworks_service import earthworks_service
@@ -29,6 +34,11 @@ __all__ = [
     'floorplan_service',
     'building_service',
     'property_service',
+    'UserProfileService', 'user_profile_service',
+    'ProjectService', 'project_service',
+    'BoundedStore',
+    'edge_store_service',
+    'site_data_store_service',
 
     'terrain_service',
     'earthworks_service',
@@ -3,11 +3,42 @@
 API Calculation Service
 Handles complex calculations extracted from routes
 """
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, List, Optional
 from .base_service import BaseService
 from . import council_service
 import time
 
+BUILDABLE_AREA_TIMEOUT_SECONDS = 30
+CALCULATION_POOL_MAX_WORKERS = 4
+
+_calculation_pool = None
+_calculation_pool_lock = threading.Lock()
+
+
+def _get_calculation_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared process pool for CPU-bound geometry"""
+    global _calculation_pool
+    if _calculation_pool is None:
+        with _calculation_pool_lock:
+            if _calculation_pool is None:
+                # Spawned workers don't inherit the server's threads, locks or open connections
+                _calculation_pool = ProcessPoolExecutor(
+                    max_workers=min(CALCULATION_POOL_MAX_WORKERS, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    return _calculation_pool
+
+
+def _calculate_buildable_area_in_worker(site_coords: List[Dict], requirements: Dict,
+                                        frontage: Optional[str] = None,
+                                        edge_classifications: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    """Module-level (picklable) entry point run inside the process pool"""
+    return api_calculation_service.calculate_buildable_area(site_coords, requirements, frontage, edge_classifications)
+
 
 class ApiCalculationService(BaseService):
     """Service for API calculation operations"""
@@ -53,6 +84,21 @@ class ApiCalculationService(BaseService):
                 'calculation_method': 'error'
             })
     
+    def calculate_buildable_area_offloaded(self, site_coords: List[Dict], requirements: Dict,
+                                           frontage: Optional[str] = None,
+                                           edge_classifications: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """Calculate buildable area in a worker process so the request thread does not hold the GIL"""
+        future = _get_calculation_pool().submit(
+            _calculate_buildable_area_in_worker,
+            site_coords, requirements, frontage, edge_classifications
+        )
+        try:
+            return future.result(timeout=BUILDABLE_AREA_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            # Drop the job if it hasn't started yet, so a backlog doesn't keep the pool busy
+            future.cancel()
+            raise
+
     def enhance_site_data(self, site_data: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance site data with calculations and external data"""
         try:
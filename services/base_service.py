@@ -24,6 +24,8 @@ class BaseService(ABC):
     
     def _log_operation(self, operation: str, details: str = "") -> None:
         """Log service operations consistently"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         message = f"{self.service_name} - {operation}"
         if details:
             message += f": {details}"
@@ -0,0 +1,49 @@
+"""
+Bounded Store Service - Size-capped, expiring server-side storage for per-session state
+"""
+import threading
+from typing import Any, Hashable, Optional
+from .base_service import CacheableService
+
+
+class BoundedStore(CacheableService):
+    """Keeps per-session state out of the signed session cookie, evicting the oldest entry when full"""
+
+    def __init__(self, service_name: str, max_size: int, cache_ttl: int = 3600):
+        super().__init__(service_name, cache_ttl=cache_ttl)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a stored value, or None if missing or expired"""
+        with self._lock:
+            value = self._get_cache(key)
+            if value is None:
+                # Drop expired entries now rather than waiting for them to be evicted
+                self._cache.pop(key, None)
+                self._cache_timestamps.pop(key, None)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full"""
+        with self._lock:
+            # Re-insert so an updated entry moves to the back of the eviction order
+            self._cache.pop(key, None)
+            if len(self._cache) >= self.max_size:
+                oldest_key = next(iter(self._cache))
+                self._cache.pop(oldest_key, None)
+                self._cache_timestamps.pop(oldest_key, None)
+            self._set_cache(key, value)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a stored value, if present"""
+        with self._lock:
+            self._cache.pop(key, None)
+            self._cache_timestamps.pop(key, None)
+
+    def clear_cache(self) -> None:
+        """Clear all stored values"""
+        with self._lock:
+            self._cache.clear()
+            self._cache_timestamps.clear()
+        self._log_operation("Cache cleared")
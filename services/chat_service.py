@@ -4,9 +4,36 @@ ChatService - Core chat processing logic
 Refactored with better error handling and performance
 """
 import asyncio
-import time
-from typing import Tuple, Generator, List, Dict, Any
+import zlib
+from functools import lru_cache
+from typing import Tuple, AsyncGenerator, List, Dict, Any
+from agents import OpenAIProvider, RunConfig, Runner, set_default_openai_client
+from openai import AsyncOpenAI
+from openai.types.responses import ResponseTextDeltaEvent
 from .base_service import BaseService
+from agent_definitions import orchestrator_agent
+from database import MessageRepository, get_conversation_history
+from prompts import adam_prompt
+from config import Config
+from constants import LLM_CACHE_TTL_SECONDS
+from utils.json_utils import dumps_bytes
+
+# Server-sent event framing, kept as bytes so chunks need no encoding at the WSGI boundary
+_SSE_DATA = b"data: "
+_SSE_SEP = b"\n\n"
+
+
+def sse_frame(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a single server-sent event frame"""
+    return _SSE_DATA + dumps_bytes(payload) + _SSE_SEP
+
+
+@lru_cache(maxsize=8)
+def _system_messages(agent_type: str = None) -> Tuple[Dict[str, str], ...]:
+    """Static system messages for an agent type, kept byte-identical for prompt caching"""
+    if agent_type == 'ADAM':
+        return ({"role": "system", "content": adam_prompt},)
+    return ()
 
 
 class ChatService(BaseService):
@@ -15,7 +42,8 @@ class ChatService(BaseService):
     def __init__(self, enable_streaming: bool = True):
         super().__init__("ChatService")
         self.enable_streaming = enable_streaming
-        self.word_delay = 0.01  # From constants
+        self._openai_clients = []
+        self._run_configs = {}
 
     async def process_message(self, user_message: str, session_id: str, conversation_id: str = None, agent_type: str = None) -> Tuple[str, str]:
         """Process user message and generate AI response"""
@@ -23,18 +51,17 @@ class ChatService(BaseService):
             agent_info = f"Agent: {agent_type}" if agent_type else "Default agent"
             self._log_operation("Processing message", f"Session {session_id[:8]}, {agent_info}")
 
-            # Save user message
-            from database import save_message, get_conversation_history
-            save_message(session_id, 'user', user_message, conversation_id)
+            # Save user message (batched by the background writer)
+            MessageRepository.enqueue_message(session_id, 'user', user_message, conversation_id)
 
             # Get conversation context
-            conversation_history = self._get_conversation_context(session_id)
+            conversation_history = await asyncio.to_thread(self._get_conversation_context, session_id)
 
             # Generate AI response
-            response_text = await self._generate_ai_response(conversation_history, agent_type)
+            response_text = await self._generate_ai_response(conversation_history, agent_type, conversation_id or session_id)
 
             # Save AI response
-            assistant_message_id = save_message(session_id, 'assistant', response_text, conversation_id)
+            assistant_message_id = MessageRepository.enqueue_message(session_id, 'assistant', response_text, conversation_id)
 
             self._log_operation("Response generated", f"{len(response_text)} characters")
             return response_text, assistant_message_id
@@ -42,10 +69,36 @@ class ChatService(BaseService):
         except Exception as e:
             return self._handle_error("process_message", e)
 
+    async def stream_message(self, user_message: str, session_id: str, conversation_id: str = None, agent_type: str = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """Process user message and yield response deltas as the agent generates them"""
+        agent_info = f"Agent: {agent_type}" if agent_type else "Default agent"
+        self._log_operation("Streaming message", f"Session {session_id[:8]}, {agent_info}")
+
+        # Save user message (batched by the background writer)
+        MessageRepository.enqueue_message(session_id, 'user', user_message, conversation_id)
+
+        # Get conversation context
+        conversation_history = await asyncio.to_thread(self._get_conversation_context, session_id)
+
+        result = Runner.run_streamed(
+            starting_agent=orchestrator_agent,
+            input=self._build_agent_input(conversation_history, agent_type),
+            run_config=self._run_config(conversation_id or session_id)
+        )
+
+        async for event in result.stream_events():
+            if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                yield {"delta": event.data.delta}
+
+        # Persist the full reply only once the stream has completed
+        response_text = result.final_output
+        assistant_message_id = MessageRepository.enqueue_message(session_id, 'assistant', response_text, conversation_id)
+
+        self._log_operation("Response streamed", f"{len(response_text)} characters")
+        yield {"done": True, "message_id": assistant_message_id}
+
     def _get_conversation_context(self, session_id: str) -> List[Dict[str, str]]:
         """Retrieve and format conversation history for AI processing"""
-        from database import get_conversation_history
-        
         history = get_conversation_history(session_id)
         self._log_operation("History retrieved", f"{len(history)} messages")
 
@@ -54,55 +107,63 @@ class ChatService(BaseService):
             for msg in history
         ]
 
-    async def _generate_ai_response(self, conversation_context: List[Dict[str, str]], agent_type: str = None) -> str:
+    async def _generate_ai_response(self, conversation_context: List[Dict[str, str]], agent_type: str = None, routing_key: str = None) -> str:
         """Generate AI response using orchestrator agent"""
         if agent_type == 'ADAM':
             self._log_operation("AI generation", "Invoking ADAM agent")
         else:
             self._log_operation("AI generation", "Invoking orchestrator agent")
 
-        from agents import Runner
-        from agent_definitions import orchestrator_agent
-
-        # Add ADAM context if specified
-        if agent_type == 'ADAM':
-            system_message = {
-                "role": "system", 
-                "content": "You are ADAM (Automated Design, Analysis and Modelling), an AI assistant specializing in engineering, structural design, and construction analysis. Provide expert guidance on structural engineering, building codes, design calculations, and project analysis."
-            }
-            conversation_context = [system_message] + conversation_context
-
         result = await Runner.run(
             starting_agent=orchestrator_agent,
-            input=conversation_context
+            input=self._build_agent_input(conversation_context, agent_type),
+            run_config=self._run_config(routing_key)
         )
 
         return result.final_output
 
-    def generate_streaming_response(self, response_text: str, message_id: str) -> Generator[str, None, None]:
-        """Generate streaming response for real-time display"""
-        try:
-            words = response_text.split()
-
-            for i, word in enumerate(words):
-                escaped_word = self._escape_json_content(word)
-
-                if i < len(words) - 1:
-                    escaped_word += " "
-
-                yield f'data: {{"delta": "{escaped_word}"}}\n\n'
-                time.sleep(self.word_delay)
-
-            yield 'data: {"done": true}\n\n'
-
-        except Exception as e:
-            escaped_error = self._escape_json_content(str(e))
-            yield f'data: {{"error": "{escaped_error}"}}\n\n'
-
-    def _escape_json_content(self, content: str) -> str:
-        """Escape content for safe JSON transmission"""
-        return (content
-                .replace('\\', '\\\\')
-                .replace('"', '\\"')
-                .replace('\n', '\\n')
-                .replace('\r', '\\r'))
+    def _build_agent_input(self, conversation_context: List[Dict[str, str]], agent_type: str = None) -> List[Dict[str, str]]:
+        """Prepend the static system prompt so the provider can reuse its cached prefix"""
+        system_messages = _system_messages(agent_type)
+        if system_messages:
+            return [dict(message) for message in system_messages] + conversation_context
+        return conversation_context
+
+    def _ensure_openai_clients(self) -> None:
+        """Lazily create one OpenAI client per inference endpoint on the running event loop"""
+        if self._openai_clients:
+            return
+
+        if Config.LLM_BASE_URLS:
+            # KV-cache retention hint, only understood by self-hosted inference servers
+            cache_headers = {'x-cache-ttl-seconds': str(LLM_CACHE_TTL_SECONDS)}
+            self._openai_clients = [
+                AsyncOpenAI(base_url=base_url, default_headers=cache_headers)
+                for base_url in Config.LLM_BASE_URLS
+            ]
+        else:
+            self._openai_clients = [AsyncOpenAI()]
+        set_default_openai_client(self._openai_clients[0])
+        self._log_operation("OpenAI clients", f"{len(self._openai_clients)} shared async client(s) created")
+
+    def _client_index(self, routing_key: str = None) -> int:
+        """Stable endpoint index for a conversation so its prompt cache stays on one backend"""
+        if not routing_key or len(self._openai_clients) == 1:
+            return 0
+        # crc32 rather than hash() so every worker process maps a conversation identically
+        return zlib.crc32(routing_key.encode('utf-8')) % len(self._openai_clients)
+
+    def _run_config(self, routing_key: str = None):
+        """Run configuration pinning this conversation to its self-hosted endpoint, memoized per endpoint"""
+        self._ensure_openai_clients()
+        if not routing_key or not Config.LLM_BASE_URLS:
+            return None
+
+        # Note: the orchestrator's as_tool sub-agents run on the default client (the first
+        # endpoint), so their calls are not pinned to this conversation's endpoint
+        client_index = self._client_index(routing_key)
+        run_config = self._run_configs.get(client_index)
+        if run_config is None:
+            run_config = RunConfig(model_provider=OpenAIProvider(openai_client=self._openai_clients[client_index]))
+            self._run_configs[client_index] = run_config
+        return run_config
@@ -0,0 +1,9 @@
+"""
+Edge Store Service - Server-side storage for per-site edge selections and classifications
+"""
+from .bounded_store_service import BoundedStore
+
+EDGE_STORE_SIZE = 4096
+
+# Global instance, keyed by (session_id, edge state key)
+edge_store_service = BoundedStore("EdgeStoreService", EDGE_STORE_SIZE)
@@ -95,7 +95,9 @@ class GeometryCalculator(BaseService):
                 print(f"[GeometryCalculator] Transformers created successfully")
 
                 # Transform polygon to local coordinates
-                local_coords = [transformer_to_local.transform(lng, lat) for lng, lat in coords]
+                coords_arr = np.asarray(coords, dtype=float)
+                local_xs, local_ys = transformer_to_local.transform(coords_arr[:, 0], coords_arr[:, 1])
+                local_coords = list(zip(local_xs.tolist(), local_ys.tolist()))
                 local_polygon = Polygon(local_coords)
                 print(f"[GeometryCalculator] Local polygon area: {local_polygon.area:.2f} m²")
             else:
@@ -210,53 +212,19 @@ class GeometryCalculator(BaseService):
             edge_types = self._classify_edges_by_frontage(edges, frontage)
             print(f"[GeometryCalculator] Edge classifications: {edge_types}")
 
-            # Create offset lines for each edge
-            offset_lines = []
-            for i, ((p1, p2), edge_type) in enumerate(zip(edges, edge_types)):
-                setback = {
-                    'front': front_setback,
-                    'rear': rear_setback,
-                    'side': side_setback
-                }.get(edge_type, side_setback)
-
-                print(f"[GeometryCalculator] Edge {i}: type={edge_type}, setback={setback}m")
-
-                # Calculate inward normal vector
-                dx, dy = p2[0] - p1[0], p2[1] - p1[1]
-                length = np.sqrt(dx**2 + dy**2)
-                print(f"[GeometryCalculator] Edge {i}: length={length:.2f}m, dx={dx:.2f}, dy={dy:.2f}")
-
-                if length > 0:
-                    nx, ny = -dy / length, dx / length
-
-                    # Ensure normal points inward
-                    centroid = polygon.centroid
-                    edge_center = ((p1[0] + p2[0])/2, (p1[1] + p2[1])/2)
-                    to_centroid_x = centroid.x - edge_center[0]
-                    to_centroid_y = centroid.y - edge_center[1]
-
-                    print(f"[GeometryCalculator] Edge {i}: normal=({nx:.3f}, {ny:.3f}), to_centroid=({to_centroid_x:.2f}, {to_centroid_y:.2f})")
-
-                    if nx * to_centroid_x + ny * to_centroid_y < 0:
-                        nx, ny = -nx, -ny
-                        print(f"[GeometryCalculator] Edge {i}: flipped normal to ({nx:.3f}, {ny:.3f})")
-
-                    offset_p1 = (p1[0] + nx * setback, p1[1] + ny * setback)
-                    offset_p2 = (p2[0] + nx * setback, p2[1] + ny * setback)
-                    offset_lines.append((offset_p1, offset_p2))
-                    print(f"[GeometryCalculator] Edge {i}: offset line created")
+            # Offset every edge at once on (N, 2) coordinate arrays
+            setback_by_type = {
+                'front': front_setback,
+                'rear': rear_setback,
+                'side': side_setback
+            }
+            setbacks = np.array([setback_by_type.get(edge_type, side_setback) for edge_type in edge_types], dtype=float)
+            starts, ends = self._offset_edges(np.asarray(coords, dtype=float), setbacks, polygon.centroid)
+            print(f"[GeometryCalculator] Created {len(starts)} offset lines")
 
             # Find intersections to create buildable polygon
-            intersection_points = []
-            for i in range(len(offset_lines)):
-                line1 = offset_lines[i]
-                line2 = offset_lines[(i + 1) % len(offset_lines)]
-                intersection = self._line_intersection(line1, line2)
-                if intersection:
-                    intersection_points.append(intersection)
-                    print(f"[GeometryCalculator] Intersection {i}: {intersection}")
-                else:
-                    print(f"[GeometryCalculator] No intersection found between lines {i} and {(i+1) % len(offset_lines)}")
+            points, found = self._consecutive_line_intersections(starts, ends)
+            intersection_points = [tuple(point) for point in points[found]]
 
             print(f"[GeometryCalculator] Found {len(intersection_points)} intersection points")
 
@@ -429,67 +397,14 @@ class GeometryCalculator(BaseService):
                     print(f"[GeometryCalculator] Edge {edge_index}: {edge_type} setback={final_setback}m (UI value)")
 
             # Create parallel offset edges maintaining one-to-one relationship
-            buildable_edges = []
-            for i in range(num_edges):
-                p1 = coords[i]
-                p2 = coords[(i + 1) % num_edges]
-                setback_info = edge_setback_map[i]
-                setback = setback_info['setback']
-
-                # Calculate perpendicular inward vector
-                dx, dy = p2[0] - p1[0], p2[1] - p1[1]
-                length = np.sqrt(dx**2 + dy**2)
-
-                if length > 0:
-                    if setback == 0:
-                        # Zero setback means no offset - use original edge
-                        offset_p1 = p1
-                        offset_p2 = p2
-                    else:
-                        # Perpendicular vector (rotated 90 degrees)
-                        nx, ny = -dy / length, dx / length
-
-                        # Ensure normal points inward toward polygon centroid
-                        centroid = polygon.centroid
-                        edge_center = ((p1[0] + p2[0])/2, (p1[1] + p2[1])/2)
-                        to_centroid_x = centroid.x - edge_center[0]
-                        to_centroid_y = centroid.y - edge_center[1]
-
-                        # Check if normal points toward centroid, flip if not
-                        if nx * to_centroid_x + ny * to_centroid_y < 0:
-                            nx, ny = -nx, -ny
-
-                        # Create parallel edge offset by setback distance
-                        offset_p1 = (p1[0] + nx * setback, p1[1] + ny * setback)
-                        offset_p2 = (p2[0] + nx * setback, p2[1] + ny * setback)
-                    
-                    buildable_edges.append({
-                        'start': offset_p1,
-                        'end': offset_p2,
-                        'original_index': i,
-                        'setback': setback,
-                        'type': setback_info['type']
-                    })
-                    
-                    print(f"[GeometryCalculator] Edge {i}: {setback_info['type']} offset by {setback}m")
-
-            # Find intersections between consecutive offset edges to form buildable polygon
-            intersection_points = []
-            for i in range(len(buildable_edges)):
-                edge1 = buildable_edges[i]
-                edge2 = buildable_edges[(i + 1) % len(buildable_edges)]
-                
-                line1 = (edge1['start'], edge1['end'])
-                line2 = (edge2['start'], edge2['end'])
-                
-                intersection = self._line_intersection(line1, line2)
-                if intersection:
-                    intersection_points.append(intersection)
-                    print(f"[GeometryCalculator] Intersection {i}-{(i+1) % len(buildable_edges)}: {intersection}")
-                else:
-                    # If no intersection, use end of first edge as fallback
-                    intersection_points.append(edge1['end'])
-                    print(f"[GeometryCalculator] No intersection found, using edge endpoint")
+            setbacks = np.array([edge_setback_map[i]['setback'] for i in range(num_edges)], dtype=float)
+            starts, ends = self._offset_edges(np.asarray(coords[:num_edges], dtype=float), setbacks, polygon.centroid)
+
+            # Find intersections between consecutive offset edges to form buildable polygon;
+            # parallel neighbours fall back to the end of the first edge
+            points, found = self._consecutive_line_intersections(starts, ends)
+            points[~found] = ends[~found]
+            intersection_points = [tuple(point) for point in points]
 
             print(f"[GeometryCalculator] Created {len(intersection_points)} buildable polygon vertices")
 
@@ -519,28 +434,57 @@ class GeometryCalculator(BaseService):
             max_setback = max(front_setback, side_setback, rear_setback)
             return polygon.buffer(-max_setback)
 
-    def _line_intersection(self, line1, line2):
-        """Find intersection point of two lines"""
+    def _offset_edges(self, coords, setbacks, centroid):
+        """Offset each polygon edge inward by its setback, returning (start, end) arrays
+
+        coords is an (N, 2) array of ring vertices and edge i runs from vertex i to i + 1.
+        Zero-length edges are dropped, as they have no direction to offset along.
+        """
+        import numpy as np
+
+        starts = coords
+        ends = np.roll(coords, -1, axis=0)
+        deltas = ends - starts
+        lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+
+        keep = lengths > 0
+        starts, ends, deltas, lengths, setbacks = starts[keep], ends[keep], deltas[keep], lengths[keep], setbacks[keep]
+
+        # Perpendicular unit vectors, flipped where they point away from the centroid
+        normals = np.column_stack((-deltas[:, 1], deltas[:, 0])) / lengths[:, None]
+        to_centroid = np.array([centroid.x, centroid.y]) - (starts + ends) / 2
+        outward = np.einsum('ij,ij->i', normals, to_centroid) < 0
+        normals[outward] *= -1
+
+        offsets = normals * setbacks[:, None]
+        return starts + offsets, ends + offsets
+
+    def _consecutive_line_intersections(self, starts, ends):
+        """Intersect each offset line with the next one, returning (points, found) arrays"""
         import numpy as np
 
-        (x1, y1), (x2, y2) = line1
-        (x3, y3), (x4, y4) = line2
+        next_starts = np.roll(starts, -1, axis=0)
+        next_ends = np.roll(ends, -1, axis=0)
 
-        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
-        if abs(denom) < 1e-10:
-            return None
+        d1 = starts - ends
+        d2 = next_starts - next_ends
+        denom = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+        found = np.abs(denom) >= 1e-10
 
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-        x = x1 + t * (x2 - x1)
-        y = y1 + t * (y2 - y1)
-        return (x, y)
+        gap = starts - next_starts
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (gap[:, 0] * d2[:, 1] - gap[:, 1] * d2[:, 0]) / denom
+        points = starts - t[:, None] * d1
+        return points, found
 
     def _transform_polygon_to_wgs84(self, polygon, transformer):
         """Transform polygon coordinates back to WGS84"""
+        import numpy as np
+
         if hasattr(polygon, 'exterior'):
-            coords_local = list(polygon.exterior.coords[:-1])
-            return [[transformer.transform(x, y)[1], transformer.transform(x, y)[0]] 
-                   for x, y in coords_local]
+            coords_local = np.asarray(polygon.exterior.coords)[:-1]
+            lngs, lats = transformer.transform(coords_local[:, 0], coords_local[:, 1])
+            return np.column_stack((lats, lngs)).tolist()
         return []
 
     def _transform_polygon_to_wgs84_fallback(self, polygon, center_lat, center_lng):
@@ -548,18 +492,14 @@ class GeometryCalculator(BaseService):
         import numpy as np
 
         if hasattr(polygon, 'exterior'):
-            coords_local = list(polygon.exterior.coords[:-1])
+            coords_local = np.asarray(polygon.exterior.coords)[:-1]
             # Convert back from approximate meters to lat/lng
             lat_factor = 111320.0  # meters per degree latitude
             lng_factor = 111320.0 * np.cos(np.radians(center_lat))  # meters per degree longitude
 
-            coords_wgs84 = []
-            for x, y in coords_local:
-                lng = center_lng + (x / lng_factor)
-                lat = center_lat + (y / lat_factor)
-                coords_wgs84.append([lat, lng])
-
-            return coords_wgs84
+            lngs = center_lng + coords_local[:, 0] / lng_factor
+            lats = center_lat + coords_local[:, 1] / lat_factor
+            return np.column_stack((lats, lngs)).tolist()
         return []
 
     def _create_error_result(self, error_message):
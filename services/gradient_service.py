@@ -7,6 +7,7 @@ import json
 import hashlib
 import math
 from typing import Dict, Any, Optional
+import numpy as np
 from .base_service import CacheableService
 
 
@@ -82,8 +83,10 @@ class GradientService(CacheableService):
         
         # Calculate slope and aspect with enhanced error handling
         try:
-            slope = self._calculate_safe_slope(site_data, coordinates)
-            aspect = self._calculate_safe_aspect(site_data, coordinates)
+            # Parse the coordinates once and share the array between slope and aspect
+            points = self._coordinate_array(coordinates)
+            slope = self._calculate_safe_slope(site_data, points)
+            aspect = self._calculate_safe_aspect(site_data, points)
             
             self._log_operation("Calculated", f"Slope: {slope}%, Aspect: {aspect}°")
             
@@ -119,7 +122,29 @@ class GradientService(CacheableService):
             self.logger.error(f"Error during gradient calculation: {calc_error}")
             return self._get_fallback_gradient_data(site_data)
     
-    def _calculate_safe_slope(self, site_data: Dict[str, Any], coordinates: list = None) -> float:
+    def _coordinate_array(self, coordinates: list) -> np.ndarray:
+        """Convert [lat, lng] pairs or {'lat', 'lng'} dicts to an (N, 2) float array, skipping malformed points"""
+        try:
+            points = np.asarray(coordinates, dtype=np.float64)
+            if points.ndim == 2 and points.shape[1] >= 2:
+                return points[:, :2]
+        except (ValueError, TypeError):
+            pass
+
+        # Mixed or dict coordinates, parse point by point
+        rows = []
+        for coord in coordinates:
+            try:
+                if isinstance(coord, dict):
+                    if 'lat' in coord and 'lng' in coord:
+                        rows.append((float(coord['lat']), float(coord['lng'])))
+                elif isinstance(coord, (list, tuple)) and len(coord) >= 2:
+                    rows.append((float(coord[0]), float(coord[1])))
+            except (ValueError, TypeError):
+                continue
+        return np.array(rows, dtype=np.float64).reshape(-1, 2)
+
+    def _calculate_safe_slope(self, site_data: Dict[str, Any], points: np.ndarray = None) -> float:
         """Calculate slope with safe fallbacks"""
         # Try existing slope data first
         for key in ['slope', 'realSlope']:
@@ -130,9 +155,9 @@ class GradientService(CacheableService):
                     continue
         
         # Try to calculate from coordinates if available
-        if coordinates and len(coordinates) >= 3:
+        if points is not None and len(points) >= 3:
             try:
-                slope = self._calculate_slope_from_coordinates(coordinates)
+                slope = self._calculate_slope_from_coordinates(points)
                 if 0 <= slope <= 100:
                     return slope
             except Exception as e:
@@ -147,33 +172,21 @@ class GradientService(CacheableService):
         else:
             return 8.0  # Small sites may be steeper
     
-    def _calculate_slope_from_coordinates(self, coordinates: list) -> float:
+    def _calculate_slope_from_coordinates(self, points: np.ndarray) -> float:
         """Calculate slope from coordinate elevation changes"""
         # This is a simplified calculation - in a real implementation
         # you'd need elevation data for each coordinate
         
         # For now, estimate based on coordinate spread
-        lats = []
-        lngs = []
-        
-        for coord in coordinates:
-            if isinstance(coord, dict):
-                if 'lat' in coord and 'lng' in coord:
-                    lats.append(float(coord['lat']))
-                    lngs.append(float(coord['lng']))
-            elif isinstance(coord, (list, tuple)) and len(coord) >= 2:
-                lats.append(float(coord[0]))
-                lngs.append(float(coord[1]))
-        
-        if len(lats) >= 3:
-            lat_range = max(lats) - min(lats)
-            lng_range = max(lngs) - min(lngs)
+        if len(points) >= 3:
+            lats = points[:, 0]
+            lat_range, lng_range = np.ptp(points, axis=0)
             
             # Convert to approximate meters (rough calculation)
             lat_meters = lat_range * 111000  # 1 degree lat ≈ 111km
-            lng_meters = lng_range * 111000 * math.cos(math.radians(sum(lats) / len(lats)))
+            lng_meters = lng_range * 111000 * math.cos(math.radians(lats.mean()))
             
-            total_distance = math.sqrt(lat_meters**2 + lng_meters**2)
+            total_distance = math.hypot(lat_meters, lng_meters)
             
             # Estimate slope based on distance - closer coordinates suggest steeper terrain
             if total_distance < 100:
@@ -187,7 +200,7 @@ class GradientService(CacheableService):
         
         return 5.0  # Default moderate slope
     
-    def _calculate_safe_aspect(self, site_data: Dict[str, Any], coordinates: list = None) -> float:
+    def _calculate_safe_aspect(self, site_data: Dict[str, Any], points: np.ndarray = None) -> float:
         """Calculate aspect with safe fallbacks"""
         # Try existing bearing first
         bearing = site_data.get('bearing')
@@ -198,9 +211,9 @@ class GradientService(CacheableService):
                 pass
         
         # Calculate from coordinates if available
-        if coordinates and len(coordinates) >= 3:
+        if points is not None and len(points) >= 3:
             try:
-                bearing = self._calculate_bearing_from_coordinates(coordinates)
+                bearing = self._calculate_bearing_from_coordinates(points)
                 if bearing is not None:
                     return bearing
             except Exception as e:
@@ -208,35 +221,15 @@ class GradientService(CacheableService):
         
         return 0.0  # Default to north-facing
     
-    def _calculate_bearing_from_coordinates(self, coordinates: list) -> float:
+    def _calculate_bearing_from_coordinates(self, points: np.ndarray) -> float:
         """Calculate bearing from coordinate points"""
-        lats, lngs = [], []
-        
-        for coord in coordinates:
-            if isinstance(coord, dict):
-                if 'lat' in coord and 'lng' in coord:
-                    try:
-                        lats.append(float(coord['lat']))
-                        lngs.append(float(coord['lng']))
-                    except (ValueError, TypeError):
-                        continue
-            elif isinstance(coord, (list, tuple)) and len(coord) >= 2:
-                try:
-                    lats.append(float(coord[0]))
-                    lngs.append(float(coord[1]))
-                except (ValueError, TypeError):
-                    continue
-        
-        if len(lats) >= 3 and len(lngs) >= 3:
+        if len(points) >= 3:
             # Calculate the general orientation of the site
-            max_lat_idx = lats.index(max(lats))
-            min_lat_idx = lats.index(min(lats))
-            
-            lat_diff = lats[max_lat_idx] - lats[min_lat_idx]
-            lng_diff = lngs[max_lat_idx] - lngs[min_lat_idx]
+            lats = points[:, 0]
+            lat_diff, lng_diff = points[lats.argmax()] - points[lats.argmin()]
             
             if abs(lat_diff) > 0.0001 or abs(lng_diff) > 0.0001:
-                bearing = math.atan2(lng_diff, lat_diff) * 180 / math.pi
+                bearing = math.degrees(math.atan2(lng_diff, lat_diff))
                 return (bearing + 360) % 360
         
         return 0.0
@@ -4,10 +4,21 @@ Location Service Module
 Handles location selection, geocoding, and validation
 """
 import requests
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, Tuple, List
 from utils.logger import app_logger
 from utils.error_handler import ErrorHandler, ErrorCategories
 
+# Shared geocoding state: successful results are cached, identical in-flight queries share one request
+GEOCODE_CACHE_TTL = 3600  # Seconds
+GEOCODE_CACHE_SIZE = 4096
+_geocode_lock = threading.Lock()
+_geocode_inflight: Dict[str, Future] = {}
+_geocode_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 
 class LocationService:
     """Service for handling location operations"""
@@ -120,6 +131,60 @@ class LocationService:
             app_logger.error(f"Unexpected geocoding error for query {query}", e)
             return None, error_msg
     
+    @staticmethod
+    def geocode_location_shared(query: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Geocode a location query, deduplicating concurrent identical queries
+
+        Successful results are cached for GEOCODE_CACHE_TTL seconds; callers that
+        arrive while the same normalized query is in flight wait for its result.
+
+        Args:
+            query: Location search query
+
+        Returns:
+            Tuple of (location_data, error_message)
+        """
+        if not query or not query.strip():
+            return LocationService.geocode_location(query)
+
+        key = query.strip().lower()[:100]
+
+        with _geocode_lock:
+            cached = _geocode_cache.get(key)
+            if cached and time.time() - cached[0] < GEOCODE_CACHE_TTL:
+                _geocode_cache.move_to_end(key)
+                return dict(cached[1]), None
+
+            future = _geocode_inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                _geocode_inflight[key] = future
+
+        if not is_owner:
+            location_data, error = future.result()
+            return (dict(location_data) if location_data else location_data), error
+
+        try:
+            result = LocationService.geocode_location(query)
+            location_data, error = result
+            if location_data and not error:
+                with _geocode_lock:
+                    # Cache a private copy, as the caller is free to mutate the dict it gets back
+                    _geocode_cache[key] = (time.time(), dict(location_data))
+                    _geocode_cache.move_to_end(key)
+                    while len(_geocode_cache) > GEOCODE_CACHE_SIZE:
+                        _geocode_cache.popitem(last=False)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _geocode_lock:
+                _geocode_inflight.pop(key, None)
+
     @staticmethod
     def validate_coordinates(lat: float, lng: float) -> Tuple[bool, List[str]]:
         """
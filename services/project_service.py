@@ -0,0 +1,87 @@
+"""
+Project Service - Cached project lookups for page rendering
+"""
+import threading
+from typing import Dict, Any, Optional
+from .base_service import CacheableService
+from .bounded_store_service import BoundedStore
+from database import db_manager
+
+PROJECT_CACHE_SIZE = 1024
+# Assembled terrain site data per (project_id, user_id), stored with the snapshot version it was built from
+PROJECT_SITE_DATA_CACHE_SIZE = 128
+
+
+class ProjectService(CacheableService):
+    """Service for short-lived caching of per-user project summaries"""
+
+    def __init__(self):
+        super().__init__("ProjectService", cache_ttl=60)  # 1 minute cache
+        self._lock = threading.Lock()
+        # Validated against the snapshot version on every read, so only invalidate() needs to drop entries
+        self.site_data_cache = BoundedStore("ProjectSiteDataCache", PROJECT_SITE_DATA_CACHE_SIZE)
+
+    def get_project_summary(self, project_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get a project's name, address, location and creation time if it belongs to the user"""
+        cache_key = (project_id, user_id)
+        with self._lock:
+            cached_project = self._get_cache(cache_key)
+        if cached_project is not None:
+            return dict(cached_project)
+
+        project = self._load_project_summary(project_id, user_id)
+        if project:
+            with self._lock:
+                if len(self._cache) >= PROJECT_CACHE_SIZE:
+                    # Drop the oldest entry, dicts keep insertion order
+                    oldest_key = next(iter(self._cache))
+                    self._cache.pop(oldest_key, None)
+                    self._cache_timestamps.pop(oldest_key, None)
+                self._set_cache(cache_key, project)
+            return dict(project)
+        return None
+
+    def invalidate(self, project_id: int, user_id: int) -> None:
+        """Drop a cached project and its assembled site data after it has been modified or deleted"""
+        with self._lock:
+            self._cache.pop((project_id, user_id), None)
+            self._cache_timestamps.pop((project_id, user_id), None)
+        self.site_data_cache.delete((project_id, user_id))
+
+    def clear_cache(self) -> None:
+        """Clear all cached projects"""
+        with self._lock:
+            self._cache.clear()
+            self._cache_timestamps.clear()
+        self.site_data_cache.clear_cache()
+        self._log_operation("Cache cleared")
+
+    def _load_project_summary(self, project_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+        """Load project summary from database"""
+        try:
+            with db_manager.db.get_read_cursor() as cursor:
+                cursor.execute('''
+                    SELECT name, address, location_lat, location_lng, created_at
+                    FROM projects 
+                    WHERE id = ? AND user_id = ?
+                ''', (project_id, user_id))
+
+                project_row = cursor.fetchone()
+                if project_row:
+                    return {
+                        'id': project_id,
+                        'name': project_row[0],
+                        'address': project_row[1],
+                        'location_lat': project_row[2],
+                        'location_lng': project_row[3],
+                        'created_at': project_row[4]
+                    }
+                return None
+
+        except Exception as e:
+            self.logger.error(f"Failed to get project summary: {e}")
+            return None
+
+
+# Global instance
+project_service = ProjectService()
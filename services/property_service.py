@@ -5,7 +5,8 @@ Handles property boundary data from LINZ and other sources
 import os
 import requests
 from typing import Dict, Any, Optional, List, Tuple
-from shapely.geometry import Point, shape
+import shapely
+from shapely.geometry import shape
 from utils.logger import app_logger
 from .base_service import BaseService
 
@@ -101,7 +102,6 @@ class PropertyService(BaseService):
     def _process_property_features(self, features: List[Dict], query_lat: float, query_lng: float) -> Dict[str, Any]:
         """Process property features from LINZ API response"""
         try:
-            query_point = Point(query_lng, query_lat)
             processed_properties = []
             containing_property = None
 
@@ -113,8 +113,13 @@ class PropertyService(BaseService):
                     # Convert geometry to Shapely object
                     parcel_shape = shape(geometry)
 
-                    # Check if this property contains the query point
-                    contains_point = parcel_shape.contains(query_point)
+                    # Check if this property contains the query point, rejecting on the
+                    # bounding box first so only candidate parcels get the exact test
+                    min_x, min_y, max_x, max_y = parcel_shape.bounds
+                    contains_point = (
+                        min_x <= query_lng <= max_x and min_y <= query_lat <= max_y
+                        and bool(shapely.contains_xy(parcel_shape, query_lng, query_lat))
+                    )
 
                     # Process polygon coordinates for Mapbox
                     property_coords = self._extract_polygon_coordinates(parcel_shape)
@@ -3,10 +3,20 @@
 Response Service
 Standardized API response formatting
 """
+from functools import lru_cache
 from typing import Dict, Any, Optional, Union, List
 from utils.logger import app_logger
+from utils.json_utils import dumps_bytes
 from .base_service import BaseService
 
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+@lru_cache(maxsize=64)
+def _success_envelope_prefix(message: str, status_code: int) -> bytes:
+    """Pre-encoded opening of a success envelope, without the closing brace"""
+    return dumps_bytes({'success': True, 'message': message, 'status_code': status_code})[:-1]
+
 
 class ResponseService(BaseService):
     """Service for standardizing API responses"""
@@ -30,6 +40,21 @@ class ResponseService(BaseService):
         
         return response, status_code
     
+    def fast_success(self, data: Dict[str, Any], message: str = "Success", status_code: int = 200) -> tuple[bytes, int, Dict[str, str]]:
+        """
+        Create a successful response body as JSON bytes, same shape as success()
+
+        The envelope prefix is encoded once per (message, status_code) and the payload
+        is spliced in directly, skipping the intermediate envelope dict.
+        """
+        data_bytes = dumps_bytes(data)
+        prefix = _success_envelope_prefix(message, status_code)
+        if len(data_bytes) > 2:
+            body = prefix + b',' + data_bytes[1:]
+        else:
+            body = prefix + b'}'
+        return body, status_code, JSON_HEADERS
+
     def error(self, message: str, status_code: int = 400, error_code: str = None, details: Any = None) -> tuple[Dict[str, Any], int]:
         """Create an error response"""
         response = {
@@ -0,0 +1,9 @@
+"""
+Site Data Store Service - Server-side storage for the active site data of each session
+"""
+from .bounded_store_service import BoundedStore
+
+SITE_DATA_STORE_SIZE = 1024
+
+# Global instance, keyed by session_id
+site_data_store_service = BoundedStore("SiteDataStoreService", SITE_DATA_STORE_SIZE)
@@ -0,0 +1,76 @@
+"""
+User Profile Service - Cached user profile lookups for page rendering
+"""
+import threading
+from typing import Dict, Any
+from .base_service import CacheableService
+from database import db_manager
+
+
+class UserProfileService(CacheableService):
+    """Service for short-lived caching of users/user_profiles lookups"""
+
+    def __init__(self):
+        super().__init__("UserProfileService", cache_ttl=60)  # 1 minute cache
+        self._lock = threading.Lock()
+
+    def get_profile(self, user_id: int) -> Dict[str, Any]:
+        """Get user profile data, served from cache when fresh"""
+        with self._lock:
+            cached_profile = self._get_cache(user_id)
+        if cached_profile is not None:
+            return dict(cached_profile)
+
+        profile = self._load_profile(user_id)
+        if profile:
+            with self._lock:
+                self._set_cache(user_id, profile)
+        return dict(profile)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a cached profile after it has been modified"""
+        with self._lock:
+            self._cache.pop(user_id, None)
+            self._cache_timestamps.pop(user_id, None)
+
+    def clear_cache(self) -> None:
+        """Clear all cached profiles"""
+        with self._lock:
+            self._cache.clear()
+            self._cache_timestamps.clear()
+        self._log_operation("Cache cleared")
+
+    def _load_profile(self, user_id: int) -> Dict[str, Any]:
+        """Load user profile data from database"""
+        try:
+            with db_manager.db.get_read_cursor() as cursor:
+                cursor.execute('''
+                    SELECT u.id, u.username, u.email, u.created_at, u.last_login,
+                           p.first_name, p.last_name, p.profile_picture, p.account_type
+                    FROM users u
+                    LEFT JOIN user_profiles p ON u.id = p.user_id
+                    WHERE u.id = ?
+                ''', (user_id,))
+
+                user_data = cursor.fetchone()
+                if user_data:
+                    return {
+                        'id': user_data[0],
+                        'username': user_data[1],
+                        'email': user_data[2],
+                        'created_at': user_data[3],
+                        'last_login': user_data[4],
+                        'first_name': user_data[5],
+                        'last_name': user_data[6],
+                        'profile_picture': user_data[7],
+                        'account_type': user_data[8] or 'individual'
+                    }
+                return {}
+
+        except Exception as e:
+            self.logger.error(f"Failed to get user profile: {e}")
+            return {}
+
+
+# Global instance
+user_profile_service = UserProfileService()
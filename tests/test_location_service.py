@@ -4,6 +4,7 @@ Tests for Location Service
 """
 import pytest
 from unittest.mock import patch, Mock
+from services import location_service
 from services.location_service import LocationService
 
 
@@ -144,6 +145,43 @@ class TestLocationService:
         assert error is not None
         assert 'empty' in error.lower()
     
+    @patch('requests.get')
+    def test_geocode_location_shared_caches_success(self, mock_get):
+        """Test shared geocoding reuses a cached result for the same normalized query"""
+        location_service._geocode_cache.clear()
+        mock_response = Mock()
+        mock_response.json.return_value = [{
+            'lat': '-36.8485',
+            'lon': '174.7633',
+            'display_name': 'Auckland, New Zealand',
+            'address': {'city': 'Auckland'},
+            'importance': 0.8
+        }]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        first, first_error = LocationService.geocode_location_shared('Auckland')
+        second, second_error = LocationService.geocode_location_shared('  auckland ')
+
+        assert first_error is None and second_error is None
+        assert first == second
+        assert mock_get.call_count == 1
+        location_service._geocode_cache.clear()
+
+    @patch('requests.get')
+    def test_geocode_location_shared_does_not_cache_errors(self, mock_get):
+        """Test shared geocoding retries queries that previously failed"""
+        import requests
+        location_service._geocode_cache.clear()
+        mock_get.side_effect = requests.exceptions.Timeout()
+
+        LocationService.geocode_location_shared('Wellington')
+        result, error = LocationService.geocode_location_shared('Wellington')
+
+        assert result is None
+        assert error is not None
+        assert mock_get.call_count == 2
+
     def test_format_location_for_storage_valid_data(self):
         """Test formatting valid location data"""
         input_data = {
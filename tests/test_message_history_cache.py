@@ -0,0 +1,107 @@
+"""
+Tests for the conversation history cache and the batched message writer
+"""
+import threading
+import time
+
+import pytest
+
+import database
+from database import ConversationHistoryCache, DatabaseConnection, MessageRepository, MessageWriteBuffer
+
+
+@pytest.fixture
+def message_db(tmp_path, monkeypatch):
+    """Point the message repository at a fresh database, write buffer and history cache"""
+    monkeypatch.setattr(database.db_manager, 'db', DatabaseConnection(str(tmp_path / 'messages.db')))
+    database.db_manager._ensure_tables_exist()
+
+    write_buffer = MessageWriteBuffer(max_linger=0.01)
+    monkeypatch.setattr(database, 'message_write_buffer', write_buffer)
+    monkeypatch.setattr(database, 'conversation_history_cache', ConversationHistoryCache())
+    return write_buffer
+
+
+def _contents(session_id):
+    return [message['content'] for message in MessageRepository.get_conversation_history(session_id)]
+
+
+class TestConversationHistoryCache:
+    """Test cases for ConversationHistoryCache kept in step with MessageWriteBuffer"""
+
+    def test_history_includes_batch_being_written(self, message_db, monkeypatch):
+        """A read while the writer thread is committing a batch waits for it instead of caching without it"""
+        batch_taken = threading.Event()
+        release_batch = threading.Event()
+        original_write = message_db._write
+
+        def slow_write(rows):
+            batch_taken.set()
+            release_batch.wait(5)
+            original_write(rows)
+
+        monkeypatch.setattr(message_db, '_write', slow_write)
+        message_db.start()
+
+        MessageRepository.enqueue_message('s1', 'user', 'first')
+        assert batch_taken.wait(5)
+
+        reader = threading.Thread(target=lambda: results.append(_contents('s1')))
+        results = []
+        reader.start()
+        time.sleep(0.05)
+        release_batch.set()
+        reader.join(5)
+
+        assert results == [['first']]
+        # The cached copy must match the table as well
+        database.conversation_history_cache.invalidate('s1')
+        assert _contents('s1') == ['first']
+
+    def test_enqueue_racing_reads_keeps_cache_complete(self, message_db):
+        """Concurrent enqueues and reads never leave the cache missing a message"""
+        message_db.start()
+        message_count = 40
+
+        def writer():
+            for i in range(message_count):
+                MessageRepository.enqueue_message('s2', 'user', f'message {i}')
+
+        def reader():
+            for _ in range(message_count):
+                MessageRepository.get_conversation_history('s2')
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        cached = sorted(_contents('s2'))
+        message_db.flush()
+        database.conversation_history_cache.invalidate('s2')
+        assert cached == sorted(_contents('s2'))
+        assert len(cached) == message_count
+
+    def test_chat_turn_rows_share_one_batch_in_order(self, message_db, monkeypatch):
+        """A user message and its reply are written by one executemany, in order, under the returned uid"""
+        batches = []
+        original_write = message_db._write
+
+        def recording_write(rows):
+            batches.append(list(rows))
+            original_write(rows)
+
+        monkeypatch.setattr(message_db, '_write', recording_write)
+
+        MessageRepository.enqueue_message('s3', 'user', 'question')
+        reply_uid = MessageRepository.enqueue_message('s3', 'assistant', 'answer')
+        message_db.flush()
+
+        assert len(batches) == 1
+        assert [row[1] for row in batches[0]] == ['user', 'assistant']
+        database.conversation_history_cache.invalidate('s3')
+        assert _contents('s3') == ['question', 'answer']
+        with database.db_manager.db.get_read_cursor() as cursor:
+            cursor.execute('SELECT content FROM messages WHERE message_uid = ?', (reply_uid,))
+            assert cursor.fetchone()['content'] == 'answer'
@@ -1,5 +1,6 @@
 from agents import function_tool
 import os
+import numpy as np
 from openai import OpenAI
 
 
@@ -27,12 +28,6 @@ def calculate_area_load(
         f"Area load = thickness × density = {thickness_m} × {density_kN_per_m3} = {area_load_kPa:.2f} kPa"
     ]
     return {
-        "inputs": {
-            "thickness_m": thickness_m,
-            "density_kN_per_m3": density_kN_per_m3,
-            "description": description,
-            "standard": standard
-        },
         "area_load_kPa": area_load_kPa,
         "calculation_steps": steps,
         "standard_reference": f"{standard} Table 3.1"
@@ -63,12 +58,6 @@ def calculate_line_load(
         f"Line load = area_load × tributary_width = {area_load_kPa} × {tributary_width_m} = {line_load_kN_per_m:.2f} kN/m"
     ]
     return {
-        "inputs": {
-            "area_load_kPa": area_load_kPa,
-            "tributary_width_m": tributary_width_m,
-            "description": description,
-            "standard": standard
-        },
         "line_load_kN_per_m": line_load_kN_per_m,
         "calculation_steps": steps,
         "standard_reference": f"{standard} Section 4"
@@ -101,14 +90,6 @@ def combine_line_loads(
         f"{combo_label}: {dead_factor} × {dead_line_load_kN_per_m} + {live_factor} × {live_line_load_kN_per_m} = {combo:.2f} kN/m"
     ]
     return {
-        "inputs": {
-            "dead_line_load_kN_per_m": dead_line_load_kN_per_m,
-            "live_line_load_kN_per_m": live_line_load_kN_per_m,
-            "dead_factor": dead_factor,
-            "live_factor": live_factor,
-            "combo_label": combo_label,
-            "standard": standard
-        },
         "combo_line_load_kN_per_m": combo,
         "calculation_steps": steps,
         "standard_reference": f"{standard} (factors: {dead_factor}G, {live_factor}Q)"
@@ -143,13 +124,6 @@ def calculate_max_moment(
         f"Max moment = {formula_desc} = {line_load_kN_per_m} × {span_m}² / 8 = {max_moment_kNm:.2f} kNm"
     ]
     return {
-        "inputs": {
-            "line_load_kN_per_m": line_load_kN_per_m,
-            "span_m": span_m,
-            "description": description,
-            "formula_type": formula_type,
-            "standard": standard
-        },
         "max_moment_kNm": max_moment_kNm,
         "calculation_steps": steps,
         "standard_reference": f"{standard} Section 6.3"
@@ -184,13 +158,6 @@ def calculate_max_shear(
         f"Max shear = {formula_desc} = {line_load_kN_per_m} × {span_m} / 2 = {max_shear_kN:.2f} kN"
     ]
     return {
-        "inputs": {
-            "line_load_kN_per_m": line_load_kN_per_m,
-            "span_m": span_m,
-            "description": description,
-            "formula_type": formula_type,
-            "standard": standard
-        },
         "max_shear_kN": max_shear_kN,
         "calculation_steps": steps,
         "standard_reference": f"{standard} Section 6.3"
@@ -198,59 +165,127 @@ def calculate_max_shear(
 
 
 @function_tool
-def list_calculation_tools() -> dict:
+def calculate_beam_batch(
+    line_loads_kN_per_m: list[float],
+    spans_m: list[float],
+    standard: str = "NZS 1170.1"
+) -> dict:
     """
-    Returns a list and description of all calculation tools (function tools) currently available.
-    Use this to check what calculations are supported by the Calculation Agent.
+    Calculates max bending moment and max shear for several simply supported beams with UDL in one call.
+    Use this instead of repeated calculate_max_moment / calculate_max_shear calls when checking multiple beams.
+    Args:
+      line_loads_kN_per_m: Uniform line load of each beam (kN/m)
+      spans_m: Span of each beam (m), in the same order as line_loads_kN_per_m
+      standard: Reference standard
+    Returns:
+      beams (each with line_load_kN_per_m, span_m, max_moment_kNm, max_shear_kN), standard_reference
     """
+    if len(line_loads_kN_per_m) != len(spans_m):
+        return {"error": f"Got {len(line_loads_kN_per_m)} line loads but {len(spans_m)} spans"}
+
+    w = np.asarray(line_loads_kN_per_m, dtype=np.float64)
+    L = np.asarray(spans_m, dtype=np.float64)
+    max_moments = (w * L * L / 8).tolist()
+    max_shears = (w * L / 2).tolist()
+
     return {
-        "supported_calculations": [
-            {
-                "name": "calculate_area_load",
-                "description": (
-                    "Calculates area load (kPa) from material thickness and density. "
-                    "Inputs: thickness_m (m), density_kN_per_m3 (kN/m³), "
-                    "description (optional), standard (optional, default NZS 1170.1)."
-                )
-            },
+        "formulas": {"max_moment_kNm": "w × L² / 8", "max_shear_kN": "w × L / 2"},
+        "beams": [
             {
-                "name": "calculate_line_load",
-                "description": (
-                    "Converts area load (kPa) to line load (kN/m) for a given tributary width. "
-                    "Inputs: area_load_kPa (kPa), tributary_width_m (m), "
-                    "description (optional), standard (optional, default NZS 1170.1)."
-                )
-            },
-            {
-                "name": "combine_line_loads",
-                "description": (
-                    "Combines dead and live line loads using specified factors for load combinations. "
-                    "Inputs: dead_line_load_kN_per_m (kN/m), live_line_load_kN_per_m (kN/m, optional), "
-                    "dead_factor (default 1.2), live_factor (default 1.5), "
-                    "combo_label (optional), standard (optional, default NZS 1170.1)."
-                )
-            },
-            {
-                "name": "calculate_max_moment",
-                "description": (
-                    "Calculates the maximum bending moment (kNm) for a beam with a uniformly distributed load. "
-                    "Inputs: line_load_kN_per_m (kN/m), span_m (m), "
-                    "description (optional), formula_type (default 'simply_supported_udl'), "
-                    "standard (optional, default NZS 1170.1)."
-                )
-            },
-            {
-                "name": "calculate_max_shear",
-                "description": (
-                    "Calculates the maximum shear force (kN) for a beam with a uniformly distributed load. "
-                    "Inputs: line_load_kN_per_m (kN/m), span_m (m), "
-                    "description (optional), formula_type (default 'simply_supported_udl'), "
-                    "standard (optional, default NZS 1170.1)."
-                )
+                "line_load_kN_per_m": load,
+                "span_m": span,
+                "max_moment_kNm": moment,
+                "max_shear_kN": shear
             }
-        ]
+            for load, span, moment, shear in zip(line_loads_kN_per_m, spans_m, max_moments, max_shears)
+        ],
+        "standard_reference": f"{standard} Section 6.3"
     }
 
+
+# Static tool listings, built once since the tools take no inputs and agents may call them repeatedly
+_CALCULATION_TOOLS = {
+    "supported_calculations": [
+        {
+            "name": "calculate_area_load",
+            "description": (
+                "Calculates area load (kPa) from material thickness and density. "
+                "Inputs: thickness_m (m), density_kN_per_m3 (kN/m³), "
+                "description (optional), standard (optional, default NZS 1170.1)."
+            )
+        },
+        {
+            "name": "calculate_line_load",
+            "description": (
+                "Converts area load (kPa) to line load (kN/m) for a given tributary width. "
+                "Inputs: area_load_kPa (kPa), tributary_width_m (m), "
+                "description (optional), standard (optional, default NZS 1170.1)."
+            )
+        },
+        {
+            "name": "combine_line_loads",
+            "description": (
+                "Combines dead and live line loads using specified factors for load combinations. "
+                "Inputs: dead_line_load_kN_per_m (kN/m), live_line_load_kN_per_m (kN/m, optional), "
+                "dead_factor (default 1.2), live_factor (default 1.5), "
+                "combo_label (optional), standard (optional, default NZS 1170.1)."
+            )
+        },
+        {
+            "name": "calculate_max_moment",
+            "description": (
+                "Calculates the maximum bending moment (kNm) for a beam with a uniformly distributed load. "
+                "Inputs: line_load_kN_per_m (kN/m), span_m (m), "
+                "description (optional), formula_type (default 'simply_supported_udl'), "
+                "standard (optional, default NZS 1170.1)."
+            )
+        },
+        {
+            "name": "calculate_max_shear",
+            "description": (
+                "Calculates the maximum shear force (kN) for a beam with a uniformly distributed load. "
+                "Inputs: line_load_kN_per_m (kN/m), span_m (m), "
+                "description (optional), formula_type (default 'simply_supported_udl'), "
+                "standard (optional, default NZS 1170.1)."
+            )
+        },
+        {
+            "name": "calculate_beam_batch",
+            "description": (
+                "Calculates maximum bending moment (kNm) and shear (kN) for several simply supported beams "
+                "with uniformly distributed loads in one call. "
+                "Inputs: line_loads_kN_per_m (list, kN/m), spans_m (list, m), "
+                "standard (optional, default NZS 1170.1)."
+            )
+        }
+    ]
+}
+
+
+@function_tool
+def list_calculation_tools() -> dict:
+    """
+    Returns a list and description of all calculation tools (function tools) currently available.
+    Use this to check what calculations are supported by the Calculation Agent.
+    """
+    return _CALCULATION_TOOLS
+
+
+# NZ standards available to the agents, code -> description
+_NZ_STANDARDS = {
+    "NZS 3404:1997": "Steel Structures Standard – Parts 1 & 2: sets minimum requirements for limit‐state design, fabrication, erection, and modification of steelwork in structures.",
+    "Building Code Handbook 3E Amdt13": "Comprehensive companion to the NZ Building Code, providing guidance, explanatory commentary, and cross‑referenced design examples.",
+    "NZS 1170.5:2004": "Structural Design Actions – Part 5: Earthquake Actions: specifies procedures to determine seismic design actions for NZ buildings (excludes Amendment 1).",
+    "NZS 3605:2001": "Timber Piles & Poles: sets performance criteria and means of compliance for timber piles and poles used in buildings, referenced in NZS 3604.",
+    "NZS 4219:2009": "Seismic Performance of Engineering Systems: covers design and installation of seismic restraints for non‑structural building services (e.g., ducts, tanks, pipework).",
+    "NZS 4121:2001": "Design for Access & Mobility: sets requirements for accessible built environments (entrances, pathways, fixtures) in compliance with Building Code accessibility clauses.",
+    "SNZ‑TS 3404:2018": "Durability Requirements for Steel Structures: technical spec complementing NZS 3404, defining coating and corrosion protection for steel in different environments.",
+    "NZS 3604:2011": "Timber‑Framed Buildings: guidance for design and construction of light timber‑framed houses and small buildings (up to 3 storeys) on good ground.",
+    "NZS 3101:2006": "Concrete Structures – Part 1 (with Amendments A1‑A3): sets minimum requirements for design of reinforced and prestressed concrete structures.",
+}
+_STANDARDS_LIST = [{"standard": code, "description": desc} for code, desc in _NZ_STANDARDS.items()]
+
+
 @function_tool
 def list_accessible_standards() -> list[dict]:
     """
@@ -258,17 +293,4 @@ def list_accessible_standards() -> list[dict]:
     Returns:
         list of dict: Each item is {"standard": str, "description": str}
     """
-
-    # Dictionary mapping: code -> description
-    nz_standards = {
-        "NZS 3404:1997": "Steel Structures Standard – Parts 1 & 2: sets minimum requirements for limit‐state design, fabrication, erection, and modification of steelwork in structures.",
-        "Building Code Handbook 3E Amdt13": "Comprehensive companion to the NZ Building Code, providing guidance, explanatory commentary, and cross‑referenced design examples.",
-        "NZS 1170.5:2004": "Structural Design Actions – Part 5: Earthquake Actions: specifies procedures to determine seismic design actions for NZ buildings (excludes Amendment 1).",
-        "NZS 3605:2001": "Timber Piles & Poles: sets performance criteria and means of compliance for timber piles and poles used in buildings, referenced in NZS 3604.",
-        "NZS 4219:2009": "Seismic Performance of Engineering Systems: covers design and installation of seismic restraints for non‑structural building services (e.g., ducts, tanks, pipework).",
-        "NZS 4121:2001": "Design for Access & Mobility: sets requirements for accessible built environments (entrances, pathways, fixtures) in compliance with Building Code accessibility clauses.",
-        "SNZ‑TS 3404:2018": "Durability Requirements for Steel Structures: technical spec complementing NZS 3404, defining coating and corrosion protection for steel in different environments.",
-        "NZS 3604:2011": "Timber‑Framed Buildings: guidance for design and construction of light timber‑framed houses and small buildings (up to 3 storeys) on good ground.",
-        "NZS 3101:2006": "Concrete Structures – Part 1 (with Amendments A1‑A3): sets minimum requirements for design of reinforced and prestressed concrete structures.",
-    }
-    return [{"standard": code, "description": desc} for code, desc in nz_standards.items()]
\ No newline at end of file
+    return _STANDARDS_LIST
\ No newline at end of file
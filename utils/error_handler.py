@@ -1,7 +1,7 @@
 """
 Centralized Error Handling System
 """
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Sequence
 from utils.logger import app_logger
 
 
@@ -191,7 +191,7 @@ def safe_execute(func, *args, error_handler=None, context=None, **kwargs):
             return None, ErrorHandler.handle_error(error)
 
 
-def validate_request_data(data: Dict, required_fields: List[str]) -> Optional[ValidationError]:
+def validate_request_data(data: Dict, required_fields: Sequence[str]) -> Optional[ValidationError]:
     """Validate request data has required fields"""
     if not data:
         return ValidationError("Request data is required")
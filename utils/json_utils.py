@@ -0,0 +1,29 @@
+"""
+JSON Utilities
+Fast JSON encoding and decoding with orjson when available, falling back to stdlib json
+"""
+import json
+from typing import Any
+
+# Try to import orjson with graceful fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads_bytes(data: bytes) -> Any:
+    """Deserialize JSON bytes, raising ValueError on malformed input"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
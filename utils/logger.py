@@ -50,6 +50,10 @@ class EnhancedLogger:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check level before building expensive log messages on hot paths"""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message: str, context: Optional[Dict[str, Any]] = None):
         self._log('DEBUG', message, context)
 
@@ -77,6 +81,10 @@ class EnhancedLogger:
         self._log('CRITICAL', message, context)
 
     def _log(self, level: str, message: str, context: Optional[Dict[str, Any]] = None):
+        # Skip context formatting entirely when the level is disabled
+        if not self.logger.isEnabledFor(logging.getLevelName(level)):
+            return
+
         extra = {}
         if context:
             extra['context'] = context
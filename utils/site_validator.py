@@ -6,6 +6,14 @@ import json
 from typing import Dict, Any, List, Optional, Tuple
 from utils.logger import app_logger
 
+# Try to import numpy for vectorized coordinate checks, fall back to per-point validation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 
 class SiteValidationError(Exception):
     """Custom exception for site validation errors"""
@@ -189,11 +197,12 @@ class SiteValidator:
             errors.append("Too many coordinate points (max 100)")
             return False, errors
 
-        # Validate each coordinate point
-        for i, coord in enumerate(coords_to_check):
-            coord_valid, coord_errors = SiteValidator.validate_coordinate_point(coord, i)
-            if not coord_valid:
-                errors.extend(coord_errors)
+        # Validate each coordinate point, only walking them one by one if the array check fails
+        if not SiteValidator._coordinate_array_valid(coords_to_check):
+            for i, coord in enumerate(coords_to_check):
+                coord_valid, coord_errors = SiteValidator.validate_coordinate_point(coord, i)
+                if not coord_valid:
+                    errors.extend(coord_errors)
 
         # Check if polygon is closed (first and last points should be close)
         if len(coords_to_check) > 2:
@@ -207,6 +216,36 @@ class SiteValidator:
 
         return len(errors) == 0, errors
 
+    @staticmethod
+    def _coordinate_array_valid(coords: List) -> bool:
+        """
+        Vectorized check that every point is a numeric [a, b] pair within lat/lng range
+
+        Applies the same [lng, lat] vs [lat, lng] heuristic as validate_coordinate_point.
+        Returns False for anything it cannot prove valid (dict points, strings, ragged
+        lists), leaving the exact per-point error messages to the slow path.
+        """
+        if not NUMPY_AVAILABLE:
+            return False
+
+        try:
+            arr = np.asarray(coords)
+        except (ValueError, TypeError):
+            return False
+
+        if arr.ndim != 2 or arr.shape[1] < 2 or arr.dtype.kind not in 'iuf':
+            return False
+
+        first, second = arr[:, 0], arr[:, 1]
+        is_lng_first = (np.abs(first) > np.abs(second)) & (np.abs(first) > 90)
+        lat = np.where(is_lng_first, second, first)
+        lng = np.where(is_lng_first, first, second)
+        return bool(
+            np.isfinite(arr[:, :2]).all()
+            and ((lat >= -90) & (lat <= 90)).all()
+            and ((lng >= -180) & (lng <= 180)).all()
+        )
+
     @staticmethod
     def validate_coordinate_point(coord: Any, index: int) -> Tuple[bool, List[str]]:
         """Validate individual coordinate point"""
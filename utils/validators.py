@@ -5,7 +5,7 @@ class ValidationError(Exception):
     """Custom validation error"""
     pass
 
-def validate_message(message: str) -> str:
+def validate_message(message: str, _max_length: int = MAX_MESSAGE_LENGTH) -> str:
     """Validate user message input"""
     if not message:
         raise ValidationError("Message cannot be empty")
@@ -14,17 +14,18 @@ def validate_message(message: str) -> str:
         raise ValidationError("Message must be a string")
 
     message = message.strip()
-    if len(message) == 0:
+    if not message:
         raise ValidationError("Message cannot be empty")
 
-    if len(message) > MAX_MESSAGE_LENGTH:
-        raise ValidationError(f"Message too long. Maximum {MAX_MESSAGE_LENGTH} characters")
+    if len(message) > _max_length:
+        raise ValidationError(f"Message too long. Maximum {_max_length} characters")
 
     return message
 
 def validate_session_id(session_id: str) -> bool:
     """Validate session ID format"""
-    if not session_id or not isinstance(session_id, str) or len(session_id.strip()) == 0:
+    # isspace() covers the whitespace-only case without allocating a stripped copy
+    if not session_id or not isinstance(session_id, str) or session_id.isspace():
         raise ValidationError("Invalid session ID format")
     return True
 